@@ -13,6 +13,7 @@ Usage:
 
 import os
 import sys
+import logging
 import argparse
 import time
 from typing import List, Optional
@@ -347,6 +348,13 @@ Examples:
     
     args = parser.parse_args()
     
+    # Configure logging once; per-test detail is only shown with --verbose
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    
     # Show banner
     print_banner()
     
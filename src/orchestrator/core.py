@@ -7,6 +7,8 @@ import os
 import sys
 import time
 import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import json
@@ -206,6 +208,16 @@ class BenchmarkOrchestrator:
         
         print(" Compiling tests for compiled languages...")
         
+        # Let each runner compile its whole batch first (TypeScript does
+        # this in parallel); anything missing is compiled file by file below
+        precompiled: Dict[str, Dict[str, Optional[str]]] = {}
+        for language, runner in self.runners.items():
+            sources = [files[language] for files in test_files.values() if language in files]
+            try:
+                precompiled[language] = runner.compile_many(sources)
+            except Exception:
+                precompiled[language] = {}
+        
         for test_name, language_files in test_files.items():
             compiled_files[test_name] = {}
             
@@ -217,7 +229,11 @@ class BenchmarkOrchestrator:
                 print(f"  Compiling {test_name}.{language}...", end=" ")
                 
                 try:
-                    compiled_file = runner.compile_test(source_file)
+                    batch = precompiled.get(language, {})
+                    if source_file in batch:
+                        compiled_file = batch[source_file]
+                    else:
+                        compiled_file = runner.compile_test(source_file)
                     if compiled_file:
                         compiled_files[test_name][language] = compiled_file
                         print("")
@@ -258,7 +274,15 @@ class BenchmarkOrchestrator:
         
         # Phase 5: Benchmark execution
         print(f"\n Executing benchmarks ({self.iterations} iterations each)...")
-        self._execute_all_tests(compiled_files)
+        trace_memory = (self.config.performance.trace_orchestrator_memory
+                        and not tracemalloc.is_tracing())
+        if trace_memory:
+            tracemalloc.start()
+        try:
+            self._execute_all_tests(compiled_files)
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
         
         # Phase 6: Results compilation
         print("\n Compiling results...")
@@ -298,34 +322,49 @@ class BenchmarkOrchestrator:
                 if language not in self.raw_results[test_name]:
                     self.raw_results[test_name][language] = []
                 
-                # Execute multiple iterations
-                for iteration in range(self.iterations):
-                    current_execution += 1
-                    progress = (current_execution / total_executions) * 100
-                    
-                    try:
-                        result = self._execute_single_test(
-                            test_name, language, executable_file, iteration
+                # Unrecorded warmup runs absorb first-run costs (page cache,
+                # dynamic loading, JIT/interpreter start-up) so iteration 0
+                # is not an outlier
+                for _ in range(self.config.performance.warmup_runs):
+                    self._collect_iteration(
+                        lambda: self._execute_single_test(
+                            test_name, language, executable_file, -1
+                        ),
+                        test_name, language, -1
+                    )
+                
+                # Execute multiple iterations (optionally overlapped; each
+                # iteration blocks in its own subprocess, so threads suffice)
+                workers = min(self.config.performance.parallel_iterations,
+                              os.cpu_count() or 1, self.iterations)
+                if workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(self._execute_single_test,
+                                            test_name, language, executable_file, iteration)
+                            for iteration in range(self.iterations)
+                        ]
+                        for iteration, future in enumerate(futures):
+                            self.raw_results[test_name][language].append(
+                                self._collect_iteration(future.result, test_name, language, iteration)
+                            )
+                    current_execution += self.iterations
+                    print(f"[{(current_execution / total_executions) * 100:.1f}%] ", end="")
+                else:
+                    for iteration in range(self.iterations):
+                        current_execution += 1
+                        progress = (current_execution / total_executions) * 100
+                        
+                        result = self._collect_iteration(
+                            lambda: self._execute_single_test(
+                                test_name, language, executable_file, iteration
+                            ),
+                            test_name, language, iteration
                         )
                         self.raw_results[test_name][language].append(result)
                         
                         if iteration == 0:  # Print status after first iteration
                             print(f"[{progress:.1f}%] ", end="")
-                    
-                    except Exception as e:
-                        # Create failed result
-                        failed_result = TestResult(
-                            execution_time=0.0,
-                            memory_usage=0,
-                            cpu_usage=0.0,
-                            output="",
-                            error=str(e),
-                            success=False,
-                            language=language,
-                            test_name=test_name,
-                            iteration=iteration
-                        )
-                        self.raw_results[test_name][language].append(failed_result)
                 
                 # Calculate and display summary for this language
                 language_results = self.raw_results[test_name][language]
@@ -337,6 +376,19 @@ class BenchmarkOrchestrator:
                 else:
                     print(f" (0/{self.iterations} success)")
     
+    def _collect_iteration(self, run, test_name: str, language: str,
+                           iteration: int) -> TestResult:
+        """Run one iteration, converting unexpected errors into a failed result."""
+        try:
+            return run()
+        except Exception as e:
+            return TestResult.failure(
+                language=language,
+                test_name=test_name,
+                iteration=iteration,
+                error=str(e)
+            )
+    
     def _execute_single_test(self, test_name: str, language: str, 
                            executable_file: str, iteration: int) -> TestResult:
         """Execute a single test iteration."""
@@ -346,7 +398,17 @@ class BenchmarkOrchestrator:
         input_data = self._load_test_input(test_name)
         
         # Execute with metrics collection
-        return runner.execute_test(executable_file, input_data, test_name, iteration)
+        if not tracemalloc.is_tracing():
+            return runner.execute_test(executable_file, input_data, test_name, iteration)
+        
+        # Isolate the orchestrator's own allocations for this iteration (the
+        # peak is process-wide, so overlapping parallel iterations share it)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = runner.execute_test(executable_file, input_data, test_name, iteration)
+        _, peak = tracemalloc.get_traced_memory()
+        result.orchestrator_memory = max(0, peak - baseline)
+        return result
     
     def _load_test_input(self, test_name: str) -> str:
         """Load input data for a test if available."""
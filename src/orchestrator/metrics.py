@@ -14,11 +14,11 @@ import threading
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from utils import json_io
 from utils.config import SystemConfig
 
 
@@ -350,8 +350,7 @@ class MetricsCollector:
         
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(metrics_dict, f, indent=2, default=serialize_datetime)
+        json_io.dump(metrics_dict, file_path, default=serialize_datetime)
 
 
 class SimpleMetricsCollector:
@@ -10,7 +10,11 @@ from typing import Dict, List, Optional, Any, Tuple
 
 @dataclass
 class TestResult:
-    """Single test execution result."""
+    """Single test execution result.
+    
+    ``output`` and ``error`` may be passed as raw bytes; they are decoded
+    (UTF-8, invalid bytes replaced) on first access only.
+    """
     execution_time: float
     memory_usage: int
     cpu_usage: float
@@ -20,7 +24,48 @@ class TestResult:
     language: str
     test_name: str
     iteration: int
+    # Peak Python allocations in the orchestrator itself while driving this
+    # iteration (bytes); 0 unless performance.trace_orchestrator_memory is set
+    orchestrator_memory: int = 0
     timestamp: datetime = field(default_factory=datetime.now)
+    
+    @classmethod
+    def failure(cls, *, language: str, test_name: str, iteration: int,
+                error: str, execution_time: float = 0.0) -> 'TestResult':
+        """Build the result for an iteration that could not run or complete."""
+        return cls(
+            execution_time=execution_time,
+            memory_usage=0,
+            cpu_usage=0.0,
+            output="",
+            error=error,
+            success=False,
+            language=language,
+            test_name=test_name,
+            iteration=iteration
+        )
+
+
+def _lazy_text(name: str) -> property:
+    """Property storing text as given and decoding bytes on first read."""
+    attr = '_' + name
+    
+    def getter(self) -> str:
+        value = self.__dict__[attr]
+        if isinstance(value, (bytes, bytearray)):
+            value = self.__dict__[attr] = value.decode('utf-8', errors='replace')
+        return value
+    
+    def setter(self, value) -> None:
+        self.__dict__[attr] = value
+    
+    return property(getter, setter)
+
+
+# Installed after @dataclass has generated __init__/__repr__/__eq__, which
+# all go through normal attribute access and therefore through the property
+TestResult.output = _lazy_text('output')
+TestResult.error = _lazy_text('error')
 
 
 @dataclass
@@ -82,3 +127,5 @@ class PerformanceSummary:
     configuration: Dict[str, Any]
     summary_statistics: Dict[str, Any]
     language_versions: Dict[str, str] = field(default_factory=dict)
+    # Per-metric (tests x languages) arrays aligned with 'tests'/'languages' axes
+    metrics_matrix: Dict[str, Any] = field(default_factory=dict)
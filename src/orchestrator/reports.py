@@ -5,7 +5,6 @@ Supports JSON, HTML, and CSV output formats with visualizations.
 
 import os
 import sys
-import json
 import csv
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -13,6 +12,7 @@ from datetime import datetime
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from utils import json_io
 from utils.config import OutputConfig
 from orchestrator.models import PerformanceSummary
 
@@ -74,8 +74,7 @@ class ReportGenerator:
         # Convert to serializable format
         report_data = self._prepare_json_data(performance_summary)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, default=self._json_serializer)
+        json_io.dump(report_data, file_path, default=self._json_serializer)
         
         print(f"   JSON report: {os.path.basename(file_path)}")
         return file_path
@@ -5,7 +5,13 @@ Aggregates raw benchmark results and generates performance analysis.
 
 import os
 import sys
+import logging
 import statistics
+from array import array
+try:
+    import numpy as np
+except ImportError:
+    np = None
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import math
@@ -21,6 +27,71 @@ from orchestrator.models import (
     PerformanceSummary
 )
 
+log = logging.getLogger(__name__)
+
+# LanguagePerformance fields exported as (tests x languages) columns
+MATRIX_METRICS = ('avg_time', 'avg_memory', 'success_rate', 'performance_score')
+
+
+class ResultColumns:
+    """Metrics of the successful runs of one (test, language) pair, stored column-wise.
+    
+    Each metric is one contiguous float64 buffer (a numpy array when numpy is
+    installed, otherwise array('d')), so the reductions below scan flat
+    memory instead of walking TestResult objects.
+    """
+    
+    def __init__(self, results: List[TestResult]):
+        successful = [r for r in results if r.success]
+        count = len(successful)
+        self.execution_time = self._column((r.execution_time for r in successful), count)
+        self.memory_usage = self._column((r.memory_usage for r in successful), count)
+        self.cpu_usage = self._column((r.cpu_usage for r in successful), count)
+    
+    def __len__(self) -> int:
+        return len(self.execution_time)
+    
+    @staticmethod
+    def _column(values, count: int):
+        if np is not None:
+            return np.fromiter(values, dtype=np.float64, count=count)
+        return array('d', values)
+    
+    @staticmethod
+    def positive(column):
+        """Entries greater than zero (unmeasured memory/CPU samples are 0)."""
+        if np is not None:
+            return column[column > 0]
+        return array('d', (v for v in column if v > 0))
+    
+    @staticmethod
+    def bounds(column) -> Tuple[float, float]:
+        """(min, max) of a non-empty column."""
+        if np is not None:
+            return float(column.min()), float(column.max())
+        return min(column), max(column)
+    
+    @staticmethod
+    def mean(column) -> float:
+        if np is not None:
+            return float(column.mean())
+        return statistics.fmean(column)
+    
+    @staticmethod
+    def stdev(column) -> float:
+        """Sample standard deviation (0.0 for fewer than two values)."""
+        if len(column) < 2:
+            return 0.0
+        if np is not None:
+            return float(column.std(ddof=1))
+        return statistics.stdev(column)
+    
+    @staticmethod
+    def median(column) -> float:
+        if np is not None:
+            return float(np.median(column))
+        return statistics.median(column)
+
 
 class ResultsCompiler:
     """Compiles and analyzes raw benchmark results."""
@@ -39,7 +110,7 @@ class ResultsCompiler:
                         system_info: Dict[str, Any] = None,
                         configuration: Dict[str, Any] = None) -> PerformanceSummary:
         """Compile raw results into performance summary."""
-        print(" Compiling benchmark results...")
+        log.info(" Compiling benchmark results...")
 
         if not raw_results:
             raise ValueError("No raw results provided")
@@ -49,7 +120,7 @@ class ResultsCompiler:
         total_executions = 0
 
         for test_name, language_results in raw_results.items():
-            print(f"  Analyzing {test_name}...")
+            log.debug("  Analyzing %s...", test_name)
 
             test_analysis = self._analyze_test_results(test_name, language_results)
             test_analyses[test_name] = test_analysis
@@ -59,11 +130,12 @@ class ResultsCompiler:
                 total_executions += len(lang_results)
 
         # Calculate overall rankings
-        print("  Calculating overall rankings...")
+        log.debug("  Calculating overall rankings...")
         overall_rankings = self._calculate_overall_rankings(test_analyses)
 
         # Generate summary statistics
         summary_stats = self._generate_summary_statistics(test_analyses, raw_results)
+        metrics_matrix = self._build_metrics_matrix(test_analyses)
 
         performance_summary = PerformanceSummary(
             benchmark_id=benchmark_id,
@@ -77,10 +149,11 @@ class ResultsCompiler:
             system_info=system_info or {},
             configuration=configuration or {},
             summary_statistics=summary_stats,
-            language_versions=language_versions or {}
+            language_versions=language_versions or {},
+            metrics_matrix=metrics_matrix
         )
         
-        print(f" Results compiled: {len(test_analyses)} tests, {total_executions} executions")
+        log.info(" Results compiled: %d tests, %d executions", len(test_analyses), total_executions)
         return performance_summary
     
     def _analyze_test_results(self, test_name: str, 
@@ -129,30 +202,27 @@ class ResultsCompiler:
                 success_rate=0, total_iterations=0, successful_iterations=0
             )
         
-        # Filter successful results for performance calculations
-        successful_results = [r for r in results if r.success]
+        columns = ResultColumns(results)
         total_iterations = len(results)
-        successful_iterations = len(successful_results)
+        successful_iterations = len(columns)
         
-        if successful_results:
+        if successful_iterations:
             # Time metrics
-            times = [r.execution_time for r in successful_results]
-            avg_time = statistics.mean(times)
-            min_time = min(times)
-            max_time = max(times)
-            std_time = statistics.stdev(times) if len(times) > 1 else 0.0
-            median_time = statistics.median(times)
+            times = columns.execution_time
+            avg_time = columns.mean(times)
+            min_time, max_time = columns.bounds(times)
+            std_time = columns.stdev(times)
+            median_time = columns.median(times)
             
             # Memory metrics
-            memories = [r.memory_usage for r in successful_results if r.memory_usage > 0]
-            avg_memory = statistics.mean(memories) if memories else 0.0
-            peak_memory = max(memories) if memories else 0
-            min_memory = min(memories) if memories else 0
+            memories = columns.positive(columns.memory_usage)
+            avg_memory = columns.mean(memories) if len(memories) else 0.0
+            min_memory, peak_memory = map(int, columns.bounds(memories)) if len(memories) else (0, 0)
             
             # CPU metrics
-            cpu_usages = [r.cpu_usage for r in successful_results if r.cpu_usage > 0]
-            avg_cpu = statistics.mean(cpu_usages) if cpu_usages else 0.0
-            max_cpu = max(cpu_usages) if cpu_usages else 0.0
+            cpu_usages = columns.positive(columns.cpu_usage)
+            avg_cpu = columns.mean(cpu_usages) if len(cpu_usages) else 0.0
+            max_cpu = columns.bounds(cpu_usages)[1] if len(cpu_usages) else 0.0
         else:
             # No successful results
             avg_time = min_time = max_time = std_time = median_time = 0.0
@@ -371,6 +441,33 @@ class ResultsCompiler:
             category_winners=category_winners
         )
     
+    def _build_metrics_matrix(self, test_analyses: Dict[str, TestAnalysis]) -> Dict[str, Any]:
+        """Lay out per-(test, language) metrics as contiguous (tests x languages) columns.
+        
+        Cells without a successful run are NaN, so column reductions should use
+        nan-aware functions (e.g. np.nanmean). Falls back to nested lists when
+        numpy is not installed.
+        """
+        tests = list(test_analyses.keys())
+        languages = sorted({lang for analysis in test_analyses.values()
+                            for lang in analysis.language_performances})
+        lang_index = {lang: j for j, lang in enumerate(languages)}
+        
+        columns = {name: [[math.nan] * len(languages) for _ in tests] for name in MATRIX_METRICS}
+        for i, analysis in enumerate(test_analyses.values()):
+            for lang, perf in analysis.language_performances.items():
+                if perf.successful_iterations == 0:
+                    continue
+                j = lang_index[lang]
+                for name in MATRIX_METRICS:
+                    columns[name][i][j] = getattr(perf, name)
+        
+        if np is not None:
+            columns = {name: np.array(rows, dtype=float).reshape(len(tests), len(languages))
+                       for name, rows in columns.items()}
+        
+        return {'tests': tests, 'languages': languages, **columns}
+    
     def _create_ranking(self, scores_by_language: Dict[str, List[float]]) -> List[Tuple[str, float]]:
         """Create ranking from scores by language."""
         avg_scores = []
@@ -5,39 +5,297 @@ Each runner handles compilation (if needed) and execution for a specific languag
 
 import os
 import sys
+import atexit
+import collections
+import contextlib
+import functools
+import glob
+import hashlib
+import json
+import mmap
+import queue
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 try:
     import psutil
 except ImportError:
     psutil = None
 import shlex
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from datetime import datetime
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from utils.config import BenchmarkConfig, LanguageConfig
+from utils.config import (BenchmarkConfig, LanguageConfig, CACHE_DIR, toolchain_fingerprint,
+                          load_json_cache, save_json_cache)
 from orchestrator.models import TestResult
 
+# Persistent Cargo target directories live here so built dependencies
+# survive between compiles
+RUST_CACHE_DIR = os.path.join(CACHE_DIR, 'rust')
+
+# TypeScript compiler detection results, keyed by toolchain fingerprint
+TSC_DETECT_CACHE = os.path.join(CACHE_DIR, 'tsc_detect.json')
+TSC_DETECT_CACHE_SCHEMA = 1
+
+# V8 code cache for tsc's own JavaScript (used by Node >= 22.1)
+NODE_COMPILE_CACHE_DIR = os.path.join(CACHE_DIR, 'node-compile-cache')
+
+# External crates recognised in Rust sources and their Cargo.toml entries
+RUST_CRATE_DEPENDENCIES = {
+    'rand': 'rand = "0.8"',
+    'serde': 'serde = { version = "1.0", features = ["derive"] }',
+    'serde_json': 'serde_json = "1.0"',
+    'regex': 'regex = "1.0"',
+    'reqwest': 'reqwest = { version = "0.11", features = ["blocking", "json"] }',
+    'clap': 'clap = { version = "4.0", features = ["derive"] }',
+    'flate2': 'flate2 = "1.0"',
+    'tokio': 'tokio = { version = "1.0", features = ["full"] }',
+    'tempfile': 'tempfile = "3.0"',
+    'lazy_static': 'lazy_static = "1.4"',
+}
+_RUST_CRATE_RE = re.compile(
+    rb'\b(' + b'|'.join(name.encode() for name in RUST_CRATE_DEPENDENCIES) + rb')::'
+)
+
+_GO_IMPORT_BLOCK_RE = re.compile(rb'import\s*\((.*?)\)', re.DOTALL)
+_GO_IMPORT_SINGLE_RE = re.compile(rb'import\s+"([^"]+)"')
+_GO_QUOTED_RE = re.compile(rb'"([^"]+)"')
+
+
+# Without wait4() there is no per-child rusage, so fall back to psutil sampling
+_NEEDS_SAMPLING = psutil is not None and not hasattr(os, 'wait4')
+
+# Python's own fds are non-inheritable (PEP 446), so on POSIX the close_fds
+# sweep is unnecessary; skipping it lets subprocess use posix_spawn()
+_CLOSE_FDS = os.name == 'nt'
+
+# Benchmark children never need a console window of their own on Windows
+_CREATION_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _job_api():
+    """Load the kernel32 job object functions (Windows only)."""
+    import ctypes
+    from ctypes import wintypes
+    
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_ulonglong) for name in (
+            'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+            'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+    
+    class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ('PerProcessUserTimeLimit', wintypes.LARGE_INTEGER),
+            ('PerJobUserTimeLimit', wintypes.LARGE_INTEGER),
+            ('LimitFlags', wintypes.DWORD),
+            ('MinimumWorkingSetSize', ctypes.c_size_t),
+            ('MaximumWorkingSetSize', ctypes.c_size_t),
+            ('ActiveProcessLimit', wintypes.DWORD),
+            ('Affinity', ctypes.c_size_t),
+            ('PriorityClass', wintypes.DWORD),
+            ('SchedulingClass', wintypes.DWORD),
+        ]
+    
+    class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+            ('IoInfo', IO_COUNTERS),
+            ('ProcessMemoryLimit', ctypes.c_size_t),
+            ('JobMemoryLimit', ctypes.c_size_t),
+            ('PeakProcessMemoryUsed', ctypes.c_size_t),
+            ('PeakJobMemoryUsed', ctypes.c_size_t),
+        ]
+    
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.SetInformationJobObject.argtypes = [
+        wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    
+    info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = 0x2000  # JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+    return kernel32, ctypes.byref(info), ctypes.sizeof(info)
+
+
+def _kill_on_close_job(process: subprocess.Popen) -> Optional[int]:
+    """Attach a Windows child to a job object that dies with its handle.
+    
+    Closing the returned handle terminates the child and every process it
+    spawned (rustc under cargo, node under npx...). Returns None elsewhere
+    or if the job could not be set up.
+    """
+    if os.name != 'nt':
+        return None
+    try:
+        kernel32, info, info_size = _job_api()
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            return None
+        # 9 = JobObjectExtendedLimitInformation
+        if not (kernel32.SetInformationJobObject(job, 9, info, info_size)
+                and kernel32.AssignProcessToJobObject(job, int(process._handle))):
+            kernel32.CloseHandle(job)
+            return None
+        return job
+    except Exception:
+        return None
+
+
+def _close_job(job: Optional[int]) -> None:
+    """Close a job handle from _kill_on_close_job, killing what is left in it."""
+    if job:
+        _job_api()[0].CloseHandle(job)
+
+
+class _RusagePopen(subprocess.Popen):
+    """Popen that records the child's own rusage when it is reaped (POSIX)."""
+    
+    rusage = None
+    
+    def _try_wait(self, wait_flags):
+        # Same contract as Popen._try_wait, but reap with wait4() so the kernel
+        # hands back exact peak RSS / CPU times for this child alone
+        if not hasattr(os, 'wait4'):
+            return super()._try_wait(wait_flags)
+        try:
+            pid, sts, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            pid, sts = self.pid, 0
+        else:
+            if pid == self.pid:
+                self.rusage = rusage
+        return (pid, sts)
+
+
+@contextlib.contextmanager
+def _mapped_source(path: str):
+    """Map a source file read-only so regexes scan it without copying."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # mmap refuses empty files
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """Resolve a tool on PATH, probing the filesystem only once."""
+    return shutil.which(tool)
+
+
+def _have(tool: str) -> bool:
+    """Check whether a tool is on PATH."""
+    return _which(tool) is not None
+
+
+class _TscDaemon:
+    """Persistent Node process compiling TypeScript via tsc_worker.cjs.
+    
+    lib.d.ts and @types are parsed once and reused for every later file
+    instead of once per tsc invocation.
+    """
+    
+    SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tsc_worker.cjs')
+    
+    def __init__(self, typescript_dir: str, env: Optional[Dict[str, str]] = None):
+        self._lock = threading.Lock()
+        self.process = subprocess.Popen(
+            [_which('node') or 'node', self.SCRIPT, typescript_dir],
+            env={**os.environ, **(env or {})},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            creationflags=_CREATION_FLAGS
+        )
+        atexit.register(self.close)
+    
+    def compile(self, args: List[str], timeout: int) -> Optional[subprocess.CompletedProcess]:
+        """Compile with tsc command-line ``args``; None if the worker is gone."""
+        with self._lock:
+            if self.process.poll() is not None:
+                return None
+            expired = threading.Event()
+            
+            def expire():
+                expired.set()
+                self.process.kill()
+            
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+            try:
+                self.process.stdin.write(json.dumps({'args': args}) + '\n')
+                self.process.stdin.flush()
+                line = self.process.stdout.readline()
+            except (OSError, ValueError):
+                line = ''
+            finally:
+                timer.cancel()
+        
+        if expired.is_set():
+            return subprocess.CompletedProcess(args, -1, '', f"Timeout after {timeout}s")
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            return None
+        return subprocess.CompletedProcess(args, 0 if reply.get('ok') else 1,
+                                           '', reply.get('output', ''))
+    
+    def close(self) -> None:
+        """Stop the worker (it exits once stdin is closed)."""
+        if self.process.poll() is not None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.process.kill()
+
 
 class BaseLanguageRunner(ABC):
     """Abstract base class for language runners."""
     
+    # Floor for the configurable sample_interval between psutil samples
+    MIN_SAMPLE_INTERVAL = 0.02
+    
+    # Captured stdout/stderr beyond this size is kept as length + hash only
+    MAX_RETAINED_OUTPUT = 1 << 20
+    
     def __init__(self, language: str, config: LanguageConfig):
         self.language = language
         self.config = config
         self.binaries_dir = "binaries"
         os.makedirs(self.binaries_dir, exist_ok=True)
+        # Source fingerprint -> compiled binary, to skip rebuilding unchanged tests
+        self._compiled: Dict[str, str] = {}
+        # Sampling monitor: one long-lived worker per runner, only where needed
+        self._monitor_queue: Optional[queue.Queue] = None
+        if _NEEDS_SAMPLING:
+            self._monitor_queue = queue.Queue()
+            threading.Thread(target=self._monitor_worker, daemon=True).start()
     
     @abstractmethod
     def compile_test(self, source_file: str) -> Optional[str]:
         """Compile test if needed, return executable path."""
         pass
     
+    def compile_many(self, source_files: List[str]) -> Dict[str, Optional[str]]:
+        """Compile several tests, mapping each source file to its executable."""
+        return {source_file: self.compile_test(source_file) for source_file in source_files}
+    
     @abstractmethod
     def execute_test(self, executable_file: str, input_data: str, 
                     test_name: str, iteration: int) -> TestResult:
@@ -45,27 +303,44 @@ class BaseLanguageRunner(ABC):
         pass
     
     def _run_command(self, command: List[str], input_data: str = "", 
-                    timeout: int = None) -> subprocess.CompletedProcess:
-        """Run a command with timeout and input data."""
+                    timeout: int = None, cwd: Optional[str] = None,
+                    env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+        """Run a command with timeout and input data, optionally in another directory.
+        
+        ``env`` holds extra variables layered over the current environment.
+        """
         timeout = timeout or self.config.timeout
+        if env is not None:
+            env = {**os.environ, **env}
+        
+        if os.name == 'nt':
+            # Run npx/tsc/... .cmd shims directly rather than via a cmd.exe shell
+            command = [_which(command[0]) or command[0]] + list(command[1:])
         
         try:
-            # For Windows, ensure proper shell handling
-            shell = False
-            if os.name == 'nt' and (command[0] in ['npx', 'npm', 'node', 'tsc'] or command[0].endswith('.cmd')):
-                shell = True
-            
-            result = subprocess.run(
+            process = subprocess.Popen(
                 command,
-                input=input_data,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                capture_output=True,
-                timeout=timeout,
-                check=False,
-                shell=shell,
-                cwd=os.getcwd()  # Explicitly set working directory
+                cwd=cwd,  # None keeps the current working directory
+                env=env,
+                creationflags=_CREATION_FLAGS
             )
-            return result
+            job = _kill_on_close_job(process)
+            try:
+                stdout, stderr = process.communicate(input_data, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # Take down the whole tree (rustc under cargo...), not just the child
+                _close_job(job)
+                job = None
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                _close_job(job)
+            return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
         except subprocess.TimeoutExpired as e:
             return subprocess.CompletedProcess(
                 args=command,
@@ -88,41 +363,142 @@ class BaseLanguageRunner(ABC):
                 stderr=str(e)
             )
     
-    def _monitor_process_metrics(self, process: subprocess.Popen, 
-                               duration: float) -> Dict[str, float]:
-        """Monitor process metrics during execution."""
-        if not psutil:
-            return {'peak_memory': 0, 'avg_cpu': 0.0}
+    @classmethod
+    def _retain_output(cls, data: bytes) -> bytes:
+        """Keep captured output, summarising it when it is too large to hold on to."""
+        if len(data) <= cls.MAX_RETAINED_OUTPUT:
+            return data
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return f"<{len(data)} bytes, blake2b {digest}>".encode('ascii')
+    
+    @staticmethod
+    def _source_fingerprint(source_file: str, dependencies: List[str]) -> str:
+        """Hash a source file together with its (sorted) dependency list."""
+        with open(source_file, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16)
+        digest.update(b'\0'.join(dep.encode('utf-8') for dep in sorted(dependencies)))
+        return digest.hexdigest()
+    
+    def _get_cached_binary(self, fingerprint: str) -> Optional[str]:
+        """Return a previously compiled binary if it is still on disk."""
+        binary = self._compiled.get(fingerprint)
+        if binary and os.path.exists(binary):
+            return binary
+        return None
+    
+    def _begin_monitoring(self, process: subprocess.Popen) -> Optional[Tuple[threading.Event, Dict[str, float]]]:
+        """Hand a freshly started process to the sampling worker, if one is needed.
+        
+        Returns a (done event, metrics dict) pair for _resource_usage, or None
+        where the kernel's rusage makes sampling unnecessary.
+        """
+        if self._monitor_queue is None:
+            return None
+        
+        done, metrics = threading.Event(), {}
+        self._monitor_queue.put((process, done, metrics))
+        return done, metrics
+    
+    def _monitor_worker(self) -> None:
+        """Sample every active process on each tick for the runner's lifetime.
+        
+        One loop serves all processes, so iterations running in parallel are
+        monitored side by side instead of waiting for each other.
+        """
+        active: List[Dict[str, Any]] = []
+        sample_interval = max(self.config.sample_interval, self.MIN_SAMPLE_INTERVAL)
+        next_tick = time.perf_counter()
+        while True:
+            # Block while idle; otherwise wake for a new process or the next tick
+            timeout = max(0.0, next_tick - time.perf_counter()) if active else None
+            try:
+                process, done, metrics = self._monitor_queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                state = self._start_monitor(process, done, metrics)
+                if state is not None:
+                    active.append(state)
+                continue
+            
+            next_tick = time.perf_counter() + sample_interval
+            active = [state for state in active if self._sample_monitor(state)]
+    
+    def _start_monitor(self, process: subprocess.Popen, done: threading.Event,
+                       metrics: Dict[str, float]) -> Optional[Dict[str, Any]]:
+        """Take the first sample of a process; None if it cannot be monitored."""
+        metrics.update({'peak_memory': 0, 'avg_cpu': 0.0})
         try:
             psutil_process = psutil.Process(process.pid)
-            initial_memory = psutil_process.memory_info().rss
-            peak_memory = initial_memory
-            cpu_samples = []
-            
-            start_time = time.time()
-            sample_interval = 0.1  # 100ms intervals
-            
-            while time.time() - start_time < duration and process.poll() is None:
-                try:
-                    memory_info = psutil_process.memory_info()
-                    peak_memory = max(peak_memory, memory_info.rss)
-                    
-                    cpu_percent = psutil_process.cpu_percent()
-                    if cpu_percent > 0:  # Valid CPU reading
-                        cpu_samples.append(cpu_percent)
-                    
-                    time.sleep(sample_interval)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    break
-            
-            avg_cpu = sum(cpu_samples) / len(cpu_samples) if cpu_samples else 0.0
-            
-            return {
-                'peak_memory': peak_memory - initial_memory,
-                'avg_cpu': avg_cpu
-            }
+            start_time, memory_info, cpu_times = self._sample_process(psutil_process)
         except Exception:
-            return {'peak_memory': 0, 'avg_cpu': 0.0}
+            done.set()
+            return None
+        return {
+            'process': process,
+            'psutil_process': psutil_process,
+            'done': done,
+            'metrics': metrics,
+            'deadline': start_time + self.config.timeout,
+            'start_time': start_time,
+            'initial_cpu': cpu_times,
+            'last_time': start_time,
+            'last_cpu': cpu_times,
+            'peak_memory': memory_info.rss,
+        }
+    
+    def _sample_monitor(self, state: Dict[str, Any]) -> bool:
+        """Sample one monitored process; finish it and return False once it is done."""
+        if state['process'].poll() is None and time.perf_counter() < state['deadline']:
+            try:
+                state['last_time'], memory_info, state['last_cpu'] = self._sample_process(
+                    state['psutil_process'])
+                # Windows tracks the peak working set itself
+                state['peak_memory'] = max(state['peak_memory'],
+                                           getattr(memory_info, 'peak_wset', 0), memory_info.rss)
+                return True
+            except Exception:
+                pass  # gone or inaccessible: report what was seen so far
+        
+        # CPU usage is derived from the process' own cpu_times() delta rather
+        # than per-sample cpu_percent(), which re-reads system-wide times
+        initial_cpu, last_cpu = state['initial_cpu'], state['last_cpu']
+        wall_delta = state['last_time'] - state['start_time']
+        cpu_delta = (last_cpu.user + last_cpu.system) - (initial_cpu.user + initial_cpu.system)
+        state['metrics'].update({
+            'peak_memory': state['peak_memory'],
+            'avg_cpu': (cpu_delta / wall_delta) * 100 if wall_delta > 0 else 0.0
+        })
+        state['done'].set()
+        return False
+    
+    def _resource_usage(self, process: subprocess.Popen, wall_time: float,
+                        monitor: Optional[Tuple[threading.Event, Dict[str, float]]] = None) -> Tuple[int, float]:
+        """Return (peak RSS in bytes, average CPU %) of a finished child.
+        
+        Both come from the kernel's rusage for that child, so nothing is
+        sampled while it runs. Where rusage is unavailable the psutil monitor
+        started by _begin_monitoring is used, else (0, 0.0) is returned.
+        """
+        rusage = getattr(process, 'rusage', None)
+        if rusage is None:
+            if monitor is None:
+                return 0, 0.0
+            done, metrics = monitor
+            done.wait(timeout=1.0)
+            return int(metrics.get('peak_memory', 0)), metrics.get('avg_cpu', 0.0)
+        # ru_maxrss is in kilobytes on Linux but bytes on macOS
+        peak_memory = rusage.ru_maxrss if sys.platform == 'darwin' else rusage.ru_maxrss * 1024
+        cpu_time = rusage.ru_utime + rusage.ru_stime
+        cpu_usage = (cpu_time / wall_time) * 100 if wall_time > 0 else 0.0
+        return peak_memory, cpu_usage
+    
+    @staticmethod
+    def _sample_process(psutil_process) -> Tuple[float, Any, Any]:
+        """Return (timestamp, memory_info, cpu_times) for a running process."""
+        # oneshot() caches the underlying /proc reads for both calls
+        with psutil_process.oneshot():
+            return time.perf_counter(), psutil_process.memory_info(), psutil_process.cpu_times()
 
 
 class PythonRunner(BaseLanguageRunner):
@@ -143,32 +519,38 @@ class PythonRunner(BaseLanguageRunner):
         if input_data:  # input_data is file path for Python tests
             command.append(input_data)
         
-        start_time = time.perf_counter()
         start_memory = 0
         
         try:
-            # For Python tests, we don't need stdin input
-            process = subprocess.Popen(
+            # Input is passed as a file path, so stdin is not needed
+            process = _RusagePopen(
                 command,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS
             )
+            # Clock starts once the child exists: pipe setup and spawn are
+            # harness overhead, interpreter/runtime start-up stays measured
+            start_time = time.perf_counter()
+            monitor = self._begin_monitoring(process)
             
             stdout, stderr = process.communicate(timeout=self.config.timeout)
             end_time = time.perf_counter()
             
             execution_time = end_time - start_time
             
-            # For Python, get basic memory info
-            memory_usage = len(stdout.encode()) + len(stderr.encode())  # Rough estimate
+            # Peak RSS from rusage; fall back to output size as a rough estimate
+            peak_memory, cpu_usage = self._resource_usage(process, execution_time, monitor)
+            memory_usage = peak_memory or len(stdout) + len(stderr)
             
             return TestResult(
                 execution_time=execution_time,
                 memory_usage=memory_usage,
-                cpu_usage=0.0,  # CPU monitoring requires more complex setup
-                output=stdout,
-                error=stderr,
+                cpu_usage=cpu_usage,
+                output=self._retain_output(stdout),
+                error=self._retain_output(stderr),
                 success=process.returncode == 0,
                 language=self.language,
                 test_name=test_name,
@@ -176,28 +558,19 @@ class PythonRunner(BaseLanguageRunner):
             )
             
         except subprocess.TimeoutExpired:
-            return TestResult(
-                execution_time=self.config.timeout,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Timeout after {self.config.timeout}s",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Timeout after {self.config.timeout}s",
+                execution_time=self.config.timeout
             )
         except Exception as e:
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=str(e),
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=str(e)
             )
 
 
@@ -206,54 +579,46 @@ class RustRunner(BaseLanguageRunner):
     
     def __init__(self, language: str, config: LanguageConfig):
         super().__init__(language, config)
-        self.temp_dirs = []  # Track temporary directories for cleanup
+        # Cargo target directories keyed by dependency set, shared across
+        # compiles (and processes) so dependency artifacts stay built
+        self._target_dirs: Dict[frozenset, str] = {}
     
     def _analyze_rust_dependencies(self, source_file: str) -> List[str]:
         """Analyze Rust source file for external crate dependencies."""
         dependencies = []
         
         try:
-            with open(source_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Look for common external crate usage
-            if 'use rand::' in content or 'rand::' in content:
-                dependencies.append('rand = "0.8"')
-            if 'use serde::' in content or 'serde::' in content:
-                dependencies.append('serde = { version = "1.0", features = ["derive"] }')
-            if 'use serde_json::' in content or 'serde_json::' in content:
-                dependencies.append('serde_json = "1.0"')
-            if 'use regex::' in content or 'regex::' in content:
-                dependencies.append('regex = "1.0"')
-            if 'use reqwest::' in content or 'reqwest::' in content:
-                dependencies.append('reqwest = { version = "0.11", features = ["blocking", "json"] }')
-            if 'use clap::' in content or 'clap::' in content:
-                dependencies.append('clap = { version = "4.0", features = ["derive"] }')
-            if 'use flate2::' in content or 'flate2::' in content:
-                dependencies.append('flate2 = "1.0"')
-            if 'use tokio::' in content or 'tokio::' in content:
-                dependencies.append('tokio = { version = "1.0", features = ["full"] }')
-            if 'use tempfile::' in content or 'tempfile::' in content:
-                dependencies.append('tempfile = "3.0"')
-            if 'use lazy_static::' in content or 'lazy_static::' in content:
-                dependencies.append('lazy_static = "1.4"')
+            # Single pass over the mapped source for every known crate path
+            with _mapped_source(source_file) as content:
+                used_crates = {match.decode() for match in _RUST_CRATE_RE.findall(content)}
+            dependencies = [dep for name, dep in RUST_CRATE_DEPENDENCIES.items()
+                            if name in used_crates]
             
         except Exception as e:
             print(f"    Warning: Could not analyze dependencies in {source_file}: {e}")
         
         return dependencies
     
+    def _get_cargo_target_dir(self, dependencies: List[str]) -> str:
+        """Return the persistent Cargo target directory for a set of dependencies."""
+        key = frozenset(dependencies)
+        if key not in self._target_dirs:
+            digest = hashlib.sha1('\n'.join(sorted(key)).encode('utf-8')).hexdigest()[:16]
+            target_dir = os.path.join(RUST_CACHE_DIR, digest)
+            os.makedirs(target_dir, exist_ok=True)
+            self._target_dirs[key] = target_dir
+        return self._target_dirs[key]
+    
     def _create_cargo_project(self, source_file: str, dependencies: List[str]) -> str:
-        """Create a temporary Cargo project for compilation."""
-        import tempfile
-        
-        # Create temporary directory
+        """Create a private Cargo project for one compilation."""
         temp_dir = tempfile.mkdtemp(prefix='benchmark_rust_')
-        self.temp_dirs.append(temp_dir)
+        os.makedirs(os.path.join(temp_dir, 'src'))
         
-        # Create Cargo.toml
+        # The package (and so binary) name is unique to this project: the
+        # target directory is shared, and another compile may finish between
+        # this build and the copy-out of its binary
         cargo_toml_content = f"""[package]
-name = "benchmark_test"
+name = "{os.path.basename(temp_dir)}"
 version = "0.1.0"
 edition = "2021"
 
@@ -261,9 +626,8 @@ edition = "2021"
 """
         
         # Add dependencies
-        if dependencies:
-            for dep in dependencies:
-                cargo_toml_content += dep + "\n"
+        for dep in sorted(dependencies):
+            cargo_toml_content += dep + "\n"
         
         # Add optimization profile
         cargo_toml_content += """
@@ -275,22 +639,56 @@ panic = "abort"
 debug = false
 """
         
-        cargo_toml_path = os.path.join(temp_dir, 'Cargo.toml')
-        with open(cargo_toml_path, 'w', encoding='utf-8') as f:
+        with open(os.path.join(temp_dir, 'Cargo.toml'), 'w', encoding='utf-8') as f:
             f.write(cargo_toml_content)
         
-        # Create src directory and copy source file as main.rs
-        src_dir = os.path.join(temp_dir, 'src')
-        os.makedirs(src_dir, exist_ok=True)
-        
-        main_rs_path = os.path.join(src_dir, 'main.rs')
-        import shutil
-        shutil.copy2(source_file, main_rs_path)
+        # Resolve to the versions the shared target directory was built with
+        lock_path = os.path.join(self._get_cargo_target_dir(dependencies), 'Cargo.lock')
+        if os.path.exists(lock_path):
+            shutil.copyfile(lock_path, os.path.join(temp_dir, 'Cargo.lock'))
         
+        shutil.copyfile(source_file, os.path.join(temp_dir, 'src', 'main.rs'))
         return temp_dir
     
-    def _compile_with_cargo(self, cargo_dir: str, base_name: str = None) -> Optional[str]:
-        """Compile Rust project using Cargo."""
+    @staticmethod
+    def _save_cargo_lock(cargo_dir: str, target_dir: str) -> None:
+        """Keep a project's resolved Cargo.lock for later projects (atomic replace)."""
+        try:
+            tmp_path = os.path.join(target_dir, f"Cargo.lock.{os.path.basename(cargo_dir)}.tmp")
+            shutil.copyfile(os.path.join(cargo_dir, 'Cargo.lock'), tmp_path)
+            os.replace(tmp_path, os.path.join(target_dir, 'Cargo.lock'))
+        except OSError:
+            pass  # The next project simply resolves again
+    
+    @staticmethod
+    def _remove_cargo_outputs(target_dir: str, package: str) -> None:
+        """Drop a finished project's artifacts from the shared target directory."""
+        release_dir = os.path.join(target_dir, 'release')
+        paths = [os.path.join(release_dir, package)]
+        paths += glob.glob(os.path.join(release_dir, package + '.*'))
+        paths += glob.glob(os.path.join(release_dir, 'deps', package + '-*'))
+        paths += glob.glob(os.path.join(release_dir, '.fingerprint', package + '-*'))
+        for path in paths:
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+    
+    @staticmethod
+    def _cargo_env() -> Dict[str, str]:
+        """Extra environment for cargo: build for the host CPU.
+        
+        Lets LLVM use every SIMD extension the machine has (AVX2, AVX-512,
+        NEON...) when vectorizing. Flags the user already set win.
+        """
+        if 'CARGO_ENCODED_RUSTFLAGS' in os.environ or 'RUSTFLAGS' in os.environ:
+            return {}
+        return {'CARGO_ENCODED_RUSTFLAGS': '-C\x1ftarget-cpu=native'}
+    
+    def _compile_with_cargo(self, cargo_dir: str, base_name: str = None,
+                            target_dir: str = None) -> Optional[str]:
+        """Compile Rust project using Cargo, into target_dir if given."""
         # Get the source file name for the output binary
         if not base_name:
             source_files = [f for f in os.listdir(os.path.join(cargo_dir, 'src')) if f.endswith('.rs')]
@@ -307,48 +705,48 @@ debug = false
                 else:
                     base_name = 'test'
         
-        # Change to cargo directory for compilation
+        # Output paths are relative to the caller's working directory; cargo
+        # itself runs with cwd=cargo_dir so no process-wide chdir is needed
         original_cwd = os.getcwd()
         
         try:
-            os.chdir(cargo_dir)
-            
-            # Run cargo build --release
-            result = self._run_command(['cargo', 'build', '--release'], timeout=120)
+            # Run cargo build --release; Cargo locks a shared target directory
+            # itself while building
+            env = self._cargo_env()
+            if target_dir:
+                env['CARGO_TARGET_DIR'] = target_dir
+            else:
+                target_dir = os.path.join(cargo_dir, 'target')
+            result = self._run_command(['cargo', 'build', '--release'], timeout=120,
+                                       cwd=cargo_dir, env=env)
             
             if result.returncode == 0:
-                # Find the compiled binary
-                target_dir = os.path.join(cargo_dir, 'target', 'release')
-                
-                # Look for the binary (name should be "benchmark_test")
-                binary_name = 'benchmark_test'
+                # The binary is named after the package, i.e. the project directory
+                binary_name = os.path.basename(cargo_dir)
                 if os.name == 'nt':  # Windows
                     binary_name += '.exe'
                 
-                binary_path = os.path.join(target_dir, binary_name)
+                binary_path = os.path.join(target_dir, 'release', binary_name)
                 
-                if os.path.exists(binary_path):
-                    # Define final output path relative to original working directory
-                    output_file = os.path.join(original_cwd, self.binaries_dir, f"{base_name}_rust")
-                    if os.name == 'nt':
-                        output_file += '.exe'
-                    
-                    # Ensure binaries directory exists
-                    os.makedirs(os.path.join(original_cwd, self.binaries_dir), exist_ok=True)
-                    
-                    # Copy binary
-                    import shutil
-                    shutil.copy2(binary_path, output_file)
-                    
-                    # Verify the copy was successful
-                    if os.path.exists(output_file):
-                        return output_file
-                    else:
-                        print(f"    Rust compilation: Failed to copy binary to {output_file}")
-                        return None
-                else:
+                # Define final output path relative to original working directory
+                output_file = os.path.join(original_cwd, self.binaries_dir, f"{base_name}_rust")
+                if os.name == 'nt':
+                    output_file += '.exe'
+                
+                # Ensure binaries directory exists
+                os.makedirs(os.path.join(original_cwd, self.binaries_dir), exist_ok=True)
+                
+                # Copy binary; copyfile takes the kernel fast path
+                # (copy_file_range/sendfile, CoW-capable) and skips the
+                # metadata copy, so only the mode needs setting. A missing
+                # binary shows up as the copy failing, no separate check.
+                try:
+                    shutil.copyfile(binary_path, output_file)
+                except FileNotFoundError:
                     print(f"    Rust compilation succeeded but binary not found at {binary_path}")
                     return None
+                os.chmod(output_file, 0o755)
+                return output_file
             else:
                 print(f"    Rust compilation failed: {result.stderr}")
                 return None
@@ -356,8 +754,6 @@ debug = false
         except Exception as e:
             print(f"    Rust compilation error: {e}")
             return None
-        finally:
-            os.chdir(original_cwd)
     
     def compile_test(self, source_file: str) -> Optional[str]:
         """Compile Rust source using Cargo with dependency management."""
@@ -365,8 +761,7 @@ debug = false
             return None
         
         # Check if Cargo is available
-        import shutil
-        if not shutil.which('cargo'):
+        if not _have('cargo'):
             print(f"    Rust compilation failed: Cargo not found. Install Rust toolchain from https://rustup.rs")
             return None
         
@@ -376,90 +771,84 @@ debug = false
         # Analyze dependencies
         dependencies = self._analyze_rust_dependencies(source_file)
         
+        # Reuse the binary if neither the source nor its dependencies changed
+        fingerprint = self._source_fingerprint(source_file, dependencies)
+        cached_binary = self._get_cached_binary(fingerprint)
+        if cached_binary:
+            return cached_binary
+        
         # Create Cargo project
         cargo_dir = self._create_cargo_project(source_file, dependencies)
+        target_dir = self._get_cargo_target_dir(dependencies)
         
         try:
-            # Compile with Cargo
-            result_binary = self._compile_with_cargo(cargo_dir, base_name)
+            # Compile with Cargo into the shared target directory, so built
+            # dependencies are reused
+            result_binary = self._compile_with_cargo(cargo_dir, base_name, target_dir)
+            if result_binary:
+                self._compiled[fingerprint] = result_binary
+                self._save_cargo_lock(cargo_dir, target_dir)
             
             return result_binary
         finally:
-            # Always cleanup temporary directory
-            self._cleanup_temp_dir(cargo_dir)
-    
-    def _cleanup_temp_dir(self, temp_dir: str):
-        """Clean up temporary directory."""
-        try:
-            import shutil
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-            if temp_dir in self.temp_dirs:
-                self.temp_dirs.remove(temp_dir)
-        except Exception as e:
-            print(f"    Warning: Could not clean up temporary directory {temp_dir}: {e}")
+            self._remove_cargo_outputs(target_dir, os.path.basename(cargo_dir))
+            shutil.rmtree(cargo_dir, ignore_errors=True)
     
     def execute_test(self, executable_file: str, input_data: str, 
                     test_name: str, iteration: int) -> TestResult:
         """Execute compiled Rust binary."""
-        if not os.path.exists(executable_file):
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Executable not found: {executable_file}",
-                success=False,
+        # One stat() gives existence, mode bits and size
+        try:
+            st = os.stat(executable_file)
+        except OSError:
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Executable not found: {executable_file}"
             )
         
         # Check if binary is executable
-        if not os.access(executable_file, os.X_OK):
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Binary not executable: {executable_file}",
-                success=False,
+        if not st.st_mode & 0o111:
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Binary not executable: {executable_file}"
             )
         
         command = [executable_file]
         if input_data:  # input_data is now file path
             command.append(input_data)
         
-        start_time = time.perf_counter()
-        
         try:
             # Skip the preliminary test for network operations that may take longer
             # Just run the actual test directly
-            process = subprocess.Popen(
+            process = _RusagePopen(
                 command,
-                stdin=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS
             )
+            start_time = time.perf_counter()
+            monitor = self._begin_monitoring(process)
             
             stdout, stderr = process.communicate(timeout=self.config.timeout)  # Removed input=input_data since file path is passed as arg
             end_time = time.perf_counter()
             
             execution_time = end_time - start_time
             
-            # Get binary size as a proxy for memory efficiency
-            binary_size = os.path.getsize(executable_file)
+            # Peak RSS from rusage; binary size is the fallback memory proxy
+            peak_memory, cpu_usage = self._resource_usage(process, execution_time, monitor)
             
             return TestResult(
                 execution_time=execution_time,
-                memory_usage=binary_size,  # Using binary size as memory metric
-                cpu_usage=0.0,
-                output=stdout,
-                error=stderr,
+                memory_usage=peak_memory or st.st_size,
+                cpu_usage=cpu_usage,
+                output=self._retain_output(stdout),
+                error=self._retain_output(stderr),
                 success=process.returncode == 0,
                 language=self.language,
                 test_name=test_name,
@@ -467,57 +856,47 @@ debug = false
             )
             
         except subprocess.TimeoutExpired:
-            return TestResult(
-                execution_time=self.config.timeout,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Timeout after {self.config.timeout}s",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Timeout after {self.config.timeout}s",
+                execution_time=self.config.timeout
             )
         except Exception as e:
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Execution error: {str(e)}",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Execution error: {str(e)}"
             )
 
 
 class GoRunner(BaseLanguageRunner):
     """Runner for Go tests with module management."""
     
+    SCRATCH_POOL_SIZE = 8
+    
     def __init__(self, language: str, config: LanguageConfig):
         super().__init__(language, config)
         self.temp_dirs = []  # Track temporary directories for cleanup
+        # Emptied module directories kept for reuse by later compiles
+        self._scratch_pool = collections.deque(maxlen=self.SCRATCH_POOL_SIZE)
     
     def _analyze_go_imports(self, source_file: str) -> List[str]:
         """Analyze Go source file for external imports."""
         imports = []
         
         try:
-            with open(source_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Look for import statements
-            import re
+            # Find import blocks in the mapped source
+            with _mapped_source(source_file) as content:
+                import_blocks = _GO_IMPORT_BLOCK_RE.findall(content)
+                single_imports = _GO_IMPORT_SINGLE_RE.findall(content)
             
-            # Find import blocks
-            import_blocks = re.findall(r'import\s*\((.*?)\)', content, re.DOTALL)
-            single_imports = re.findall(r'import\s+"([^"]+)"', content)
-            
-            all_imports = single_imports
+            all_imports = [imp.decode('utf-8') for imp in single_imports]
             for block in import_blocks:
-                block_imports = re.findall(r'"([^"]+)"', block)
-                all_imports.extend(block_imports)
+                block_imports = _GO_QUOTED_RE.findall(block)
+                all_imports.extend(imp.decode('utf-8') for imp in block_imports)
             
             # Filter for external packages (not standard library)
             external_imports = []
@@ -537,14 +916,14 @@ class GoRunner(BaseLanguageRunner):
     
     def _setup_go_module(self, source_file: str, imports: List[str]) -> str:
         """Set up a temporary Go module for compilation."""
-        import tempfile
-        
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp(prefix='benchmark_go_')
-        self.temp_dirs.append(temp_dir)
+        # Reuse an emptied scratch directory when one is available
+        if self._scratch_pool:
+            temp_dir = self._scratch_pool.pop()
+        else:
+            temp_dir = tempfile.mkdtemp(prefix='benchmark_go_')
+            self.temp_dirs.append(temp_dir)
         
         # Copy source file - rename if it ends with _test.go
-        import shutil
         base_name = os.path.basename(source_file)
         if base_name.endswith('_test.go'):
             # Rename to avoid Go thinking it's a test file
@@ -553,7 +932,7 @@ class GoRunner(BaseLanguageRunner):
             new_name = base_name
             
         go_file_path = os.path.join(temp_dir, new_name)
-        shutil.copy2(source_file, go_file_path)
+        shutil.copyfile(source_file, go_file_path)
         
         # Create go.mod - always create one for proper module support
         go_mod_content = """module benchmark_test
@@ -568,16 +947,16 @@ go 1.19
     
     def _compile_with_modules(self, module_dir: str) -> Optional[str]:
         """Compile Go source with proper module context."""
+        # go commands run with cwd=module_dir; no process-wide chdir is needed
         original_cwd = os.getcwd()
         
         try:
-            os.chdir(module_dir)
-            
             # Find the Go source file
-            go_files = [f for f in os.listdir('.') if f.endswith('.go') and not f.endswith('_test.go')]
+            module_files = os.listdir(module_dir)
+            go_files = [f for f in module_files if f.endswith('.go') and not f.endswith('_test.go')]
             if not go_files:
                 # Fallback: look for any .go files including renamed ones
-                go_files = [f for f in os.listdir('.') if f.endswith('.go')]
+                go_files = [f for f in module_files if f.endswith('.go')]
                 if not go_files:
                     print(f"    Go compilation failed: No Go source file found in {module_dir}")
                     return None
@@ -589,9 +968,9 @@ go 1.19
                 base_name = base_name.replace('_benchmark', '_test')
             
             # Initialize module if go.mod exists
-            if os.path.exists('go.mod'):
+            if 'go.mod' in module_files:
                 # Run go mod tidy to resolve dependencies
-                tidy_result = self._run_command(['go', 'mod', 'tidy'], timeout=60)
+                tidy_result = self._run_command(['go', 'mod', 'tidy'], timeout=60, cwd=module_dir)
                 if tidy_result.returncode != 0:
                     print(f"    Go mod tidy failed: {tidy_result.stderr}")
                     # Continue anyway, might still compile
@@ -607,7 +986,7 @@ go 1.19
             # Compile with go build - handle renamed files properly
             compile_cmd = ['go', 'build', '-ldflags', '-s -w', '-o', output_file, source_file]
             
-            result = self._run_command(compile_cmd, timeout=60)
+            result = self._run_command(compile_cmd, timeout=60, cwd=module_dir)
             
             if result.returncode == 0 and os.path.exists(output_file):
                 return output_file
@@ -619,8 +998,6 @@ go 1.19
         except Exception as e:
             print(f"    Go compilation error: {e}")
             return None
-        finally:
-            os.chdir(original_cwd)
     
     def compile_test(self, source_file: str) -> Optional[str]:
         """Compile Go source with module management."""
@@ -628,29 +1005,55 @@ go 1.19
             return None
         
         # Check if Go is available
-        import shutil
-        if not shutil.which('go'):
+        if not _have('go'):
             print(f"    Go compilation failed: Go compiler not found. Install Go from https://golang.org")
             return None
         
         # Analyze imports
         imports = self._analyze_go_imports(source_file)
         
+        # Reuse the binary if neither the source nor its imports changed
+        fingerprint = self._source_fingerprint(source_file, imports)
+        cached_binary = self._get_cached_binary(fingerprint)
+        if cached_binary:
+            return cached_binary
+        
         # Setup Go module
         module_dir = self._setup_go_module(source_file, imports)
         
         # Compile with modules
         result_binary = self._compile_with_modules(module_dir)
         
-        # Cleanup temporary directory
-        self._cleanup_temp_dir(module_dir)
+        # Return the module directory to the scratch pool
+        self._release_temp_dir(module_dir)
+        
+        if result_binary:
+            self._compiled[fingerprint] = result_binary
         
         return result_binary
     
+    def _release_temp_dir(self, temp_dir: str):
+        """Empty a module directory and keep it for the next compile."""
+        if len(self._scratch_pool) == self._scratch_pool.maxlen:
+            self._cleanup_temp_dir(temp_dir)
+            return
+        
+        try:
+            for entry in os.scandir(temp_dir):
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        except Exception as e:
+            print(f"    Warning: Could not reset temporary directory {temp_dir}: {e}")
+            self._cleanup_temp_dir(temp_dir)
+            return
+        
+        self._scratch_pool.appendleft(temp_dir)
+    
     def _cleanup_temp_dir(self, temp_dir: str):
         """Clean up temporary directory."""
         try:
-            import shutil
             if os.path.exists(temp_dir):
                 shutil.rmtree(temp_dir)
             if temp_dir in self.temp_dirs:
@@ -661,31 +1064,24 @@ go 1.19
     def execute_test(self, executable_file: str, input_data: str, 
                     test_name: str, iteration: int) -> TestResult:
         """Execute compiled Go binary."""
-        if not os.path.exists(executable_file):
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Executable not found: {executable_file}",
-                success=False,
+        # One stat() gives existence, mode bits and size
+        try:
+            st = os.stat(executable_file)
+        except OSError:
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Executable not found: {executable_file}"
             )
         
         # Check if binary is executable
-        if not os.access(executable_file, os.X_OK):
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Binary not executable: {executable_file}",
-                success=False,
+        if not st.st_mode & 0o111:
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Binary not executable: {executable_file}"
             )
         
         command = [executable_file]
@@ -694,73 +1090,62 @@ go 1.19
             normalized_path = os.path.normpath(input_data)
             command.append(normalized_path)
         
-        start_time = time.perf_counter()
-        
         try:
-            # For Windows, ensure proper shell handling for binaries
-            shell = False
-            if os.name == 'nt':
-                shell = True
-            
-            process = subprocess.Popen(
+            process = _RusagePopen(
                 command,
-                stdin=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                shell=shell
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS
             )
+            start_time = time.perf_counter()
+            monitor = self._begin_monitoring(process)
             
             stdout, stderr = process.communicate(timeout=self.config.timeout)
             end_time = time.perf_counter()
             
             execution_time = end_time - start_time
             
-            # Get binary size
-            binary_size = os.path.getsize(executable_file)
+            # Peak RSS from rusage; binary size is the fallback memory proxy
+            peak_memory, cpu_usage = self._resource_usage(process, execution_time, monitor)
+            
+            result = TestResult(
+                execution_time=execution_time,
+                memory_usage=peak_memory or st.st_size,
+                cpu_usage=cpu_usage,
+                output=self._retain_output(stdout),
+                error=self._retain_output(stderr),
+                success=process.returncode == 0,
+                language=self.language,
+                test_name=test_name,
+                iteration=iteration
+            )
             
             # Log execution details for debugging
             if process.returncode != 0:
+                stdout, stderr = result.output, result.error
                 print(f"    Go execution failed with return code {process.returncode}")
                 print(f"    Command: {' '.join(command)}")
                 print(f"    Stdout: {stdout[:200]}..." if len(stdout) > 200 else f"    Stdout: {stdout}")
                 print(f"    Stderr: {stderr[:200]}..." if len(stderr) > 200 else f"    Stderr: {stderr}")
             
-            return TestResult(
-                execution_time=execution_time,
-                memory_usage=binary_size,
-                cpu_usage=0.0,
-                output=stdout,
-                error=stderr,
-                success=process.returncode == 0,
-                language=self.language,
-                test_name=test_name,
-                iteration=iteration
-            )
+            return result
             
         except subprocess.TimeoutExpired:
-            return TestResult(
-                execution_time=self.config.timeout,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Timeout after {self.config.timeout}s",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Timeout after {self.config.timeout}s",
+                execution_time=self.config.timeout
             )
         except Exception as e:
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Execution error: {str(e)}",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Execution error: {str(e)}"
             )
 
 
@@ -792,46 +1177,46 @@ class CppRunner(BaseLanguageRunner):
     def execute_test(self, executable_file: str, input_data: str, 
                     test_name: str, iteration: int) -> TestResult:
         """Execute compiled C++ binary."""
-        if not os.path.exists(executable_file):
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Executable not found: {executable_file}",
-                success=False,
+        try:
+            st = os.stat(executable_file)
+        except OSError:
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Executable not found: {executable_file}"
             )
         
         command = [executable_file]
         if input_data:
             command.append(input_data)
         
-        start_time = time.perf_counter()
-        
         try:
-            process = subprocess.Popen(
+            process = _RusagePopen(
                 command,
-                stdin=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS
             )
+            start_time = time.perf_counter()
+            monitor = self._begin_monitoring(process)
             
             stdout, stderr = process.communicate(timeout=self.config.timeout)
             end_time = time.perf_counter()
             
             execution_time = end_time - start_time
-            binary_size = os.path.getsize(executable_file)
+            
+            # Peak RSS from rusage; binary size is the fallback memory proxy
+            peak_memory, cpu_usage = self._resource_usage(process, execution_time, monitor)
             
             return TestResult(
                 execution_time=execution_time,
-                memory_usage=binary_size,
-                cpu_usage=0.0,
-                output=stdout,
-                error=stderr,
+                memory_usage=peak_memory or st.st_size,
+                cpu_usage=cpu_usage,
+                output=self._retain_output(stdout),
+                error=self._retain_output(stderr),
                 success=process.returncode == 0,
                 language=self.language,
                 test_name=test_name,
@@ -839,44 +1224,94 @@ class CppRunner(BaseLanguageRunner):
             )
             
         except subprocess.TimeoutExpired:
-            return TestResult(
-                execution_time=self.config.timeout,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Timeout after {self.config.timeout}s",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Timeout after {self.config.timeout}s",
+                execution_time=self.config.timeout
             )
         except Exception as e:
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Execution error: {str(e)}",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Execution error: {str(e)}"
             )
 
 
 class TypeScriptRunner(BaseLanguageRunner):
     """Runner for TypeScript tests."""
     
+    # ES module output for every compilation method
+    TSC_FLAGS = [
+        '--target', 'ES2020',
+        '--module', 'es2020',
+        '--moduleResolution', 'node',
+        '--skipLibCheck'  # .d.ts files are not ours to check
+    ]
+    
+    # Only with strict_check: type errors fail the compile
+    STRICT_FLAGS = ['--strict', '--noEmitOnError']
+    
+    # tsc exit status: 0 clean, 2 diagnostics reported but JavaScript emitted
+    TSC_EMITTED_CODES = (0, 2)
+    
+    # Detected compilation method, shared by all instances and probed lazily
+    _tsc_method: Optional[str] = None
+    
+    # Fingerprint of the toolchain behind _tsc_method (see _tsc_detection_key)
+    _toolchain_key: Optional[str] = None
+    
+    # Persistent compiler worker shared by all instances; False once unusable
+    _daemon = None
+    
+    # argv prefix for each one-shot compilation method
+    TSC_COMMANDS = {
+        'global_tsc': ('tsc',),
+        'npx_tsc': ('npx', 'tsc'),
+        'local_tsc': (os.path.join('node_modules', '.bin', 'tsc.cmd' if os.name == 'nt' else 'tsc'),),
+    }
+    
     def __init__(self, language: str, config: LanguageConfig):
         super().__init__(language, config)
-        self.tsc_available = self._check_tsc_availability()
+        try:
+            os.makedirs(NODE_COMPILE_CACHE_DIR, exist_ok=True)
+        except OSError:
+            pass  # Node simply runs without the cache
+    
+    @staticmethod
+    def _node_env() -> Dict[str, str]:
+        """Extra environment for Node-based tools: reuse V8's compiled code."""
+        if 'NODE_COMPILE_CACHE' in os.environ:
+            return {}
+        return {'NODE_COMPILE_CACHE': NODE_COMPILE_CACHE_DIR}
+    
+    @property
+    def tsc_available(self) -> str:
+        """Which TypeScript compilation method is available."""
+        if TypeScriptRunner._tsc_method is None:
+            # The probes cold-start Node several times, so results are also
+            # kept on disk for later processes with the same toolchain
+            key = TypeScriptRunner._toolchain_key = self._tsc_detection_key()
+            method = load_json_cache(TSC_DETECT_CACHE, TSC_DETECT_CACHE_SCHEMA).get(key)
+            if method is None:
+                method = self._check_tsc_availability()
+                if method != 'none':  # keep re-probing until a setup works
+                    save_json_cache(TSC_DETECT_CACHE, TSC_DETECT_CACHE_SCHEMA, {key: method},
+                                    "TypeScript detection cache")
+            TypeScriptRunner._tsc_method = method
+        return TypeScriptRunner._tsc_method
+    
+    @staticmethod
+    def _tsc_detection_key() -> str:
+        """Fingerprint the visible TypeScript toolchain (PATH, cwd, tool mtimes)."""
+        return toolchain_fingerprint(['tsc', 'npx', os.path.join('node_modules', '.bin', 'tsc')])
     
     def _check_tsc_availability(self) -> str:
         """Check which TypeScript compilation method is available."""
-        import shutil
-        
         # Check for global tsc installation
-        if shutil.which('tsc'):
+        if _have('tsc'):
             try:
                 result = subprocess.run(
                     ['tsc', '--version'],
@@ -890,7 +1325,7 @@ class TypeScriptRunner(BaseLanguageRunner):
                 pass
         
         # Check for npx availability
-        if shutil.which('npx'):
+        if _have('npx'):
             try:
                 result = subprocess.run(
                     ['npx', 'tsc', '--version'],
@@ -927,7 +1362,7 @@ class TypeScriptRunner(BaseLanguageRunner):
         if not os.path.exists(source_file):
             return None
         
-        if self.tsc_available == 'none':
+        if not self._use_esbuild() and self.tsc_available == 'none':
             print(f"    TypeScript compilation failed: No TypeScript compiler found")
             print(f"    Please install TypeScript using one of these methods:")
             print(f"      1. Global: npm install -g typescript")
@@ -935,162 +1370,296 @@ class TypeScriptRunner(BaseLanguageRunner):
             print(f"      3. Via npx: Ensure Node.js is installed")
             return None
         
+        # Reuse emitted JavaScript while the source, flags and toolchain
+        # are unchanged, within this process and across runs
+        fingerprint = self._js_fingerprint(source_file)
+        cached_js = self._get_cached_binary(fingerprint)
+        if cached_js:
+            return cached_js
+        
         # Generate output directory
         base_name = os.path.splitext(os.path.basename(source_file))[0]
         output_dir = os.path.join(self.binaries_dir, f"{base_name}_ts")
         os.makedirs(output_dir, exist_ok=True)
         
-        # Try compilation with available method
-        js_file = None
-        if self.tsc_available == 'global_tsc':
-            js_file = self._compile_with_global_tsc(source_file, output_dir, base_name)
-        elif self.tsc_available == 'npx_tsc':
-            js_file = self._compile_with_npx_tsc(source_file, output_dir, base_name)
-        elif self.tsc_available == 'local_tsc':
-            js_file = self._compile_with_local_tsc(source_file, output_dir, base_name)
-        
-        if js_file and os.path.exists(js_file):
-            return js_file
-        else:
-            return None
-    
-    def _compile_with_global_tsc(self, source_file: str, output_dir: str, base_name: str) -> Optional[str]:
-        """Compile using global tsc command."""
         js_file = os.path.join(output_dir, f"{base_name}.js")
-        
-        # Change to project directory to ensure @types/node is available
-        original_cwd = os.getcwd()
-        
+        cache_dir = self._js_cache_dir()
+        cache_file = os.path.join(cache_dir, f"{fingerprint}.js")
         try:
-            # Use more specific TypeScript compilation flags for ES modules
-            compile_cmd = [
-                'tsc', source_file,
-                '--outDir', output_dir,
-                '--target', 'ES2020',
-                '--module', 'es2020',
-                '--moduleResolution', 'node',
-                '--strict',
-                '--noEmitOnError'
-            ]
+            shutil.copyfile(cache_file, js_file)
+        except FileNotFoundError:
+            js_file = self._compile_to_js(source_file, output_dir, base_name)
+            if not js_file:
+                return None
+            os.makedirs(cache_dir, exist_ok=True)
+            shutil.copyfile(js_file, cache_file)
+        
+        self._compiled[fingerprint] = js_file
+        return js_file
+    
+    def compile_many(self, source_files: List[str]) -> Dict[str, Optional[str]]:
+        """Compile several tests, running one-shot compiler processes in parallel."""
+        if len(source_files) < 2:
+            return super().compile_many(source_files)
+        
+        if not self._use_esbuild():
+            # Detect once up front so worker threads never race on it
+            if self.tsc_available == 'none':
+                return super().compile_many(source_files)
             
-            result = self._run_command(compile_cmd)
+            # The persistent worker compiles one file at a time anyway
+            if TypeScriptRunner._daemon is None:
+                TypeScriptRunner._daemon = self._start_daemon() or False
+            if TypeScriptRunner._daemon:
+                return super().compile_many(source_files)
             
+            # One tsc program for everything not cached yet; whatever it
+            # could not produce is compiled file by file below
+            self._compile_batch(source_files)
+        
+        workers = min(os.cpu_count() or 1, len(source_files))
+        if workers < 2:
+            return super().compile_many(source_files)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(source_files, executor.map(self.compile_test, source_files)))
+    
+    def _tsc_flags(self) -> List[str]:
+        """Compiler flags for this runner's configuration."""
+        if self.config.strict_check:
+            return self.TSC_FLAGS + self.STRICT_FLAGS
+        return self.TSC_FLAGS
+    
+    def _tsc_succeeded(self, returncode: int) -> bool:
+        """Whether a tsc exit status counts as a successful compile.
+        
+        Without strict_check type errors are only reported: tsc still emits
+        the JavaScript and exits with 2.
+        """
+        if self.config.strict_check:
+            return returncode == 0
+        return returncode in self.TSC_EMITTED_CODES
+    
+    def _use_esbuild(self) -> bool:
+        """Transpile with esbuild when type-checking is not wanted."""
+        return not self.config.strict_check and _have('esbuild')
+    
+    def _js_fingerprint(self, source_file: str) -> str:
+        """Cache key for the JavaScript emitted from a source file."""
+        if self._use_esbuild():
+            esbuild_path = _which('esbuild')
+            compiler = f"esbuild:{esbuild_path}:{os.stat(esbuild_path).st_mtime_ns}"
+        else:
+            compiler = TypeScriptRunner._toolchain_key or ''
+        return self._source_fingerprint(source_file, self._tsc_flags() + [compiler])
+    
+    def _js_cache_dir(self) -> str:
+        """Directory holding emitted JavaScript by fingerprint."""
+        return os.path.join(self.binaries_dir, '.jscache')
+    
+    def _tsc_command(self) -> List[str]:
+        """Command prefix for the detected one-shot tsc."""
+        return list(self.TSC_COMMANDS.get(self.tsc_available, ('tsc',)))
+    
+    def _compile_batch(self, source_files: List[str]) -> None:
+        """Compile several sources in one tsc program, filling the JS cache.
+        
+        lib.d.ts and @types are then loaded once for the whole batch. With
+        strict_check (--noEmitOnError) a single bad file fails the batch, in
+        which case the caller's per-file compiles report it.
+        """
+        cache_dir = self._js_cache_dir()
+        pending: Dict[str, str] = {}
+        for source_file in source_files:
+            if not os.path.exists(source_file):
+                continue
+            cache_file = os.path.join(cache_dir, f"{self._js_fingerprint(source_file)}.js")
+            if not os.path.exists(cache_file):
+                pending[os.path.abspath(source_file)] = cache_file
+        if len(pending) < 2:
+            return
+        
+        batch_dir = os.path.abspath(os.path.join(self.binaries_dir, '_ts_batch'))
+        root_dir = os.path.commonpath([os.path.dirname(path) for path in pending])
+        config_path = os.path.join(self.binaries_dir, '_bench_tsconfig.json')
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'compilerOptions': {
+                    'outDir': batch_dir,
+                    'rootDir': root_dir,
+                    'incremental': True,
+                    'tsBuildInfoFile': os.path.join(batch_dir, '.tsbuildinfo')
+                },
+                'files': sorted(pending)
+            }, f, indent=2)
+        
+        # Command-line flags override the project file, keeping _tsc_flags()
+        # the single source of compiler options
+        result = self._run_command(self._tsc_command() + ['-p', config_path] + self._tsc_flags(),
+                                   timeout=120, env=self._node_env())
+        if not self._tsc_succeeded(result.returncode):
+            return
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        for source_path, cache_file in pending.items():
+            emitted = os.path.join(
+                batch_dir, os.path.splitext(os.path.relpath(source_path, root_dir))[0] + '.js'
+            )
+            if os.path.exists(emitted):
+                shutil.copyfile(emitted, cache_file)
+    
+    def _compile_to_js(self, source_file: str, output_dir: str, base_name: str) -> Optional[str]:
+        """Run the TypeScript compiler for one source file."""
+        if self._use_esbuild():
+            return self._compile_with_esbuild(source_file, output_dir, base_name)
+        
+        # Prefer the persistent compiler; a failure there is a real
+        # compile error, so only fall back when the worker is unavailable
+        result = self._compile_with_daemon(source_file, output_dir)
+        if result is not None:
+            js_file = os.path.join(output_dir, f"{base_name}.js")
             if result.returncode == 0 and os.path.exists(js_file):
                 return js_file
-            else:
-                print(f"    TypeScript compilation failed: {result.stderr}")
-                return None
-        finally:
-            os.chdir(original_cwd)
+            print(f"    TypeScript compilation failed: {result.stderr}")
+            return None
+        
+        if self.tsc_available not in self.TSC_COMMANDS:
+            return None
+        return self._compile_with_tsc(source_file, output_dir, base_name)
     
-    def _compile_with_npx_tsc(self, source_file: str, output_dir: str, base_name: str) -> Optional[str]:
-        """Compile using npx tsc command."""
+    def _compile_with_esbuild(self, source_file: str, output_dir: str, base_name: str) -> Optional[str]:
+        """Transpile without type-checking using esbuild."""
         js_file = os.path.join(output_dir, f"{base_name}.js")
+        compile_cmd = [
+            'esbuild', source_file,
+            f'--outfile={js_file}',
+            '--format=esm',
+            '--platform=node',
+            '--target=es2020',
+            '--log-level=warning'
+        ]
         
-        # Change to project directory to ensure @types/node is available
-        original_cwd = os.getcwd()
+        result = self._run_command(compile_cmd, timeout=60)
         
-        try:
-            # Use npx to run TypeScript compiler with ES modules
-            compile_cmd = [
-                'npx', 'tsc', source_file,
-                '--outDir', output_dir,
-                '--target', 'ES2020',
-                '--module', 'es2020',
-                '--moduleResolution', 'node',
-                '--strict',
-                '--noEmitOnError'
+        if result.returncode == 0 and os.path.exists(js_file):
+            return js_file
+        else:
+            print(f"    TypeScript compilation failed: {result.stderr}")
+            return None
+    
+    def _compile_with_daemon(self, source_file: str, output_dir: str) -> Optional[subprocess.CompletedProcess]:
+        """Compile through the shared tsc worker; None if it is unavailable."""
+        if TypeScriptRunner._daemon is None:
+            TypeScriptRunner._daemon = self._start_daemon() or False
+        if not TypeScriptRunner._daemon:
+            return None
+        
+        result = TypeScriptRunner._daemon.compile(
+            [source_file, '--outDir', output_dir] + self._tsc_flags(), timeout=60
+        )
+        if result is None:
+            print(f"    Warning: TypeScript compiler worker stopped, using one-shot tsc")
+            TypeScriptRunner._daemon.close()
+            TypeScriptRunner._daemon = False
+        return result
+    
+    def _start_daemon(self) -> Optional[_TscDaemon]:
+        """Start the tsc worker against the TypeScript package tsc would use."""
+        if not _have('node'):
+            return None
+        
+        candidates = [os.path.join('node_modules', 'typescript')]
+        tsc_path = _which('tsc')
+        if self.tsc_available == 'global_tsc' and tsc_path:
+            candidates = [
+                # <prefix>/bin/tsc -> .../typescript/bin/tsc
+                os.path.dirname(os.path.dirname(os.path.realpath(tsc_path))),
+                # Windows npm shim next to its node_modules
+                os.path.join(os.path.dirname(tsc_path), 'node_modules', 'typescript'),
             ]
-            
-            result = self._run_command(compile_cmd, timeout=60)
-            
-            if result.returncode == 0 and os.path.exists(js_file):
-                return js_file
-            else:
-                print(f"    TypeScript compilation failed: {result.stderr}")
-                return None
-        finally:
-            os.chdir(original_cwd)
+        
+        for typescript_dir in candidates:
+            if os.path.isfile(os.path.join(typescript_dir, 'package.json')):
+                try:
+                    return _TscDaemon(os.path.abspath(typescript_dir), self._node_env())
+                except OSError as e:
+                    print(f"    Warning: Could not start TypeScript compiler worker: {e}")
+                    return None
+        return None
     
-    def _compile_with_local_tsc(self, source_file: str, output_dir: str, base_name: str) -> Optional[str]:
-        """Compile using local node_modules tsc command."""
+    @staticmethod
+    def _incremental_flags(output_dir: str) -> List[str]:
+        """Let one-shot tsc reuse the previous run's type-check state."""
+        return ['--incremental', '--tsBuildInfoFile', os.path.join(output_dir, '.tsbuildinfo')]
+    
+    def _compile_with_tsc(self, source_file: str, output_dir: str, base_name: str) -> Optional[str]:
+        """Compile using the detected one-shot tsc command."""
         js_file = os.path.join(output_dir, f"{base_name}.js")
         
-        # Change to project directory to ensure @types/node is available
-        original_cwd = os.getcwd()
+        compile_cmd = [
+            *self._tsc_command(), source_file,
+            '--outDir', output_dir,
+            *self._tsc_flags(),
+            *self._incremental_flags(output_dir)
+        ]
         
-        try:
-            # Use local TypeScript compiler with ES modules
-            tsc_path = os.path.join('node_modules', '.bin', 'tsc')
-            if os.name == 'nt':  # Windows
-                tsc_path += '.cmd'
-            
-            compile_cmd = [
-                tsc_path, source_file,
-                '--outDir', output_dir,
-                '--target', 'ES2020',
-                '--module', 'es2020',
-                '--moduleResolution', 'node',
-                '--strict',
-                '--noEmitOnError'
-            ]
-            
-            result = self._run_command(compile_cmd, timeout=60)
-            
-            if result.returncode == 0 and os.path.exists(js_file):
-                return js_file
-            else:
-                print(f"    TypeScript compilation failed: {result.stderr}")
-                return None
-        finally:
-            os.chdir(original_cwd)
+        result = self._run_command(compile_cmd, timeout=60, env=self._node_env())
+        
+        if self._tsc_succeeded(result.returncode) and os.path.exists(js_file):
+            return js_file
+        else:
+            print(f"    TypeScript compilation failed: {result.stdout}{result.stderr}")
+            return None
     
     def execute_test(self, executable_file: str, input_data: str, 
                     test_name: str, iteration: int) -> TestResult:
         """Execute compiled JavaScript via Node.js."""
-        if not os.path.exists(executable_file):
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error="JavaScript file not found",
-                success=False,
+        try:
+            st = os.stat(executable_file)
+        except OSError:
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error="JavaScript file not found"
             )
         
-        command = [self.config.executable, executable_file]
+        # A full interpreter path (not a bare "node") keeps subprocess on its
+        # posix_spawn() path and skips the PATH search on every iteration.
+        # No --snapshot-blob: a snapshot's main function cannot import() the
+        # compiled ES module (ERR_VM_DYNAMIC_IMPORT_CALLBACK_MISSING), and
+        # Node start-up is measured like every other runtime's anyway
+        command = [_which(self.config.executable) or self.config.executable, executable_file]
         command.extend(self.config.runtime_args)
         if input_data:  # input_data is now file path
             command.append(input_data)
         
-        start_time = time.perf_counter()
-        
         try:
-            process = subprocess.Popen(
+            process = _RusagePopen(
                 command,
-                stdin=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS
             )
+            start_time = time.perf_counter()
+            monitor = self._begin_monitoring(process)
             
             stdout, stderr = process.communicate(timeout=self.config.timeout)
             end_time = time.perf_counter()
             
             execution_time = end_time - start_time
             
-            # Get file size
-            file_size = os.path.getsize(executable_file)
+            # Peak RSS from rusage; script size is the fallback memory proxy
+            peak_memory, cpu_usage = self._resource_usage(process, execution_time, monitor)
             
             return TestResult(
                 execution_time=execution_time,
-                memory_usage=file_size,
-                cpu_usage=0.0,
-                output=stdout,
-                error=stderr,
+                memory_usage=peak_memory or st.st_size,
+                cpu_usage=cpu_usage,
+                output=self._retain_output(stdout),
+                error=self._retain_output(stderr),
                 success=process.returncode == 0,
                 language=self.language,
                 test_name=test_name,
@@ -1098,28 +1667,19 @@ class TypeScriptRunner(BaseLanguageRunner):
             )
             
         except subprocess.TimeoutExpired:
-            return TestResult(
-                execution_time=self.config.timeout,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=f"Timeout after {self.config.timeout}s",
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=f"Timeout after {self.config.timeout}s",
+                execution_time=self.config.timeout
             )
         except Exception as e:
-            return TestResult(
-                execution_time=0.0,
-                memory_usage=0,
-                cpu_usage=0.0,
-                output="",
-                error=str(e),
-                success=False,
+            return TestResult.failure(
                 language=self.language,
                 test_name=test_name,
-                iteration=iteration
+                iteration=iteration,
+                error=str(e)
             )
 
 
@@ -0,0 +1,75 @@
+// Long-lived TypeScript compiler used by TypeScriptRunner.
+//
+// Usage: node tsc_worker.cjs <path to the typescript package>
+//
+// Reads one JSON request per line on stdin: {"args": [...tsc CLI args]}
+// and answers each with one JSON line on stdout: {"ok": bool, "output": str}.
+// Parsed source files (lib.d.ts, @types/*) are kept between requests, so
+// only the benchmark file itself is parsed again for each compilation.
+'use strict';
+
+const fs = require('fs');
+const readline = require('readline');
+const ts = require(process.argv[2]);
+
+const sourceCache = new Map();  // fileName -> {mtimeMs, sourceFile}
+let oldProgram;
+
+function createHost(options) {
+  const host = ts.createCompilerHost(options);
+  const getSourceFile = host.getSourceFile;
+  host.getSourceFile = (fileName, languageVersion, onError, shouldCreate) => {
+    let mtimeMs;
+    try {
+      mtimeMs = fs.statSync(fileName).mtimeMs;
+    } catch (e) {
+      return getSourceFile(fileName, languageVersion, onError, shouldCreate);
+    }
+    const cached = sourceCache.get(fileName);
+    if (cached && cached.mtimeMs === mtimeMs &&
+        cached.sourceFile.languageVersion === languageVersion) {
+      return cached.sourceFile;
+    }
+    const sourceFile = getSourceFile(fileName, languageVersion, onError, shouldCreate);
+    if (sourceFile) {
+      sourceCache.set(fileName, { mtimeMs, sourceFile });
+    }
+    return sourceFile;
+  };
+  return host;
+}
+
+function compile(args) {
+  const parsed = ts.parseCommandLine(args);
+  if (parsed.errors.length) {
+    return { ok: false, output: ts.formatDiagnostics(parsed.errors, formatHost) };
+  }
+  const program = ts.createProgram(parsed.fileNames, parsed.options,
+                                    createHost(parsed.options), oldProgram);
+  oldProgram = program;
+  const emitResult = program.emit();
+  const diagnostics = ts.getPreEmitDiagnostics(program).concat(emitResult.diagnostics);
+  const hasErrors = diagnostics.some((d) => d.category === ts.DiagnosticCategory.Error);
+  // Like tsc itself: errors only fail the compile under --noEmitOnError,
+  // otherwise the JavaScript is emitted and the diagnostics are just output
+  return {
+    ok: !emitResult.emitSkipped && !(parsed.options.noEmitOnError && hasErrors),
+    output: ts.formatDiagnostics(diagnostics, formatHost),
+  };
+}
+
+const formatHost = {
+  getCanonicalFileName: (fileName) => fileName,
+  getCurrentDirectory: ts.sys.getCurrentDirectory,
+  getNewLine: () => ts.sys.newLine,
+};
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+  let response;
+  try {
+    response = compile(JSON.parse(line).args);
+  } catch (e) {
+    response = { ok: false, output: String(e && e.stack || e) };
+  }
+  process.stdout.write(JSON.stringify(response) + '\n');
+});
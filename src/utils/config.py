@@ -3,11 +3,64 @@ Configuration management for the multi-language benchmark tool.
 Handles loading, validation, and access to benchmark configuration.
 """
 
+import functools
+import hashlib
 import json
 import os
-from typing import Dict, List, Any, Optional
+import shutil
+import types
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 
+from utils import json_io
+
+# Per-user cache shared by the runners and the environment validator
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'polyglot-bench'
+)
+
+
+def toolchain_fingerprint(tools: List[str], *extra: str) -> str:
+    """Fingerprint a toolchain: extra parts, PATH, cwd and each tool's path and mtime."""
+    parts = [*extra, os.environ.get('PATH', ''), os.getcwd()]
+    for tool in tools:
+        tool_path = shutil.which(tool)
+        try:
+            parts.append(f"{tool_path}:{os.stat(tool_path).st_mtime_ns}")
+        except (OSError, TypeError):
+            parts.append(f"{tool_path}:-")
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def load_json_cache(path: str, schema: int) -> Dict[str, Any]:
+    """Load the entries of a persisted cache; empty if missing, unreadable or another schema."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('schema') != schema:
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_json_cache(path: str, schema: int, entries: Dict[str, Any], description: str) -> bool:
+    """Merge entries into a persisted cache (best effort, atomic replace)."""
+    # Keep entries other processes saved since this one loaded the file
+    entries = {**load_json_cache(path, schema), **entries}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'schema': schema, 'entries': entries}, f)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        print(f"    Warning: Could not save {description}: {e}")
+        return False
+
 
 @dataclass
 class LanguageConfig:
@@ -20,6 +73,9 @@ class LanguageConfig:
     compile_cmd: Optional[str] = None
     binary_extension: Optional[str] = None
     runtime_args: List[str] = field(default_factory=list)
+    sample_interval: float = 0.1
+    # Full type-checking when compiling (TypeScript); off = transpile only
+    strict_check: bool = False
 
 
 @dataclass
@@ -41,6 +97,10 @@ class PerformanceConfig:
     warmup_runs: int = 2
     timeout_per_test: int = 120
     memory_sampling_interval: float = 0.1
+    # >1 overlaps iterations of a test; keep at 1 for contention-free timings
+    parallel_iterations: int = 1
+    # Record orchestrator-side Python allocations per iteration (tracemalloc)
+    trace_orchestrator_memory: bool = False
 
 
 @dataclass
@@ -66,25 +126,43 @@ class BenchmarkConfig:
     def __init__(self, config_path: str = "bench.config.json"):
         self.config_path = config_path
         self.raw_config: Dict[str, Any] = {}
-        self.languages: Dict[str, LanguageConfig] = {}
-        self.test_suites: Dict[str, TestSuiteConfig] = {}
+        self.languages: Mapping[str, LanguageConfig] = {}
+        self.test_suites: Mapping[str, TestSuiteConfig] = {}
+        self._all_tests: Tuple[str, ...] = ()
         self.performance: PerformanceConfig = PerformanceConfig()
         self.output: OutputConfig = OutputConfig()
         self.system: SystemConfig = SystemConfig()
         
         self.load_configuration()
     
-    def load_configuration(self) -> None:
-        """Load and parse the configuration file."""
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_raw(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Parse a configuration file; memoized until the file changes.
         
+        The result is shared between instances and must not be mutated.
+        """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.raw_config = json.load(f)
+            return json_io.load(path)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
+    
+    def load_configuration(self) -> None:
+        """Load and parse the configuration file."""
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
+        self.raw_config = self._load_raw(os.path.abspath(self.config_path),
+                                         st.st_mtime_ns, st.st_size)
+        self._apply_raw_config()
+    
+    def _apply_raw_config(self) -> None:
+        """Derive all typed configuration from raw_config."""
+        languages: Dict[str, LanguageConfig] = {}
+        test_suites: Dict[str, TestSuiteConfig] = {}
+        self.languages, self.test_suites = languages, test_suites
         self._parse_languages()
         self._parse_test_suites()
         self._parse_performance()
@@ -92,6 +170,13 @@ class BenchmarkConfig:
         self._parse_system()
         
         self._validate_configuration()
+        
+        # Parsed once; read-only views can be shared across threads
+        self.languages = types.MappingProxyType(languages)
+        self.test_suites = types.MappingProxyType(test_suites)
+        self._all_tests = tuple(dict.fromkeys(
+            test for suite in test_suites.values() if suite.enabled for test in suite.tests
+        ))
     
     def _parse_languages(self) -> None:
         """Parse language configurations."""
@@ -106,7 +191,9 @@ class BenchmarkConfig:
                 compile_required=lang_config.get('compile_required', False),
                 compile_cmd=lang_config.get('compile_cmd'),
                 binary_extension=lang_config.get('binary_extension', ''),
-                runtime_args=lang_config.get('runtime_args', [])
+                runtime_args=lang_config.get('runtime_args', []),
+                sample_interval=lang_config.get('sample_interval', 0.1),
+                strict_check=lang_config.get('strict_check', False)
             )
     
     def _parse_test_suites(self) -> None:
@@ -132,7 +219,9 @@ class BenchmarkConfig:
             iterations=perf_config.get('iterations', 10),
             warmup_runs=perf_config.get('warmup_runs', 2),
             timeout_per_test=perf_config.get('timeout_per_test', 120),
-            memory_sampling_interval=perf_config.get('memory_sampling_interval', 0.1)
+            memory_sampling_interval=perf_config.get('memory_sampling_interval', 0.1),
+            parallel_iterations=perf_config.get('parallel_iterations', 1),
+            trace_orchestrator_memory=perf_config.get('trace_orchestrator_memory', False)
         )
     
     def _parse_output(self) -> None:
@@ -197,25 +286,30 @@ class BenchmarkConfig:
     
     def get_all_tests(self) -> List[str]:
         """Get all test names from enabled test suites."""
-        all_tests = []
-        for suite in self.test_suites.values():
-            if suite.enabled:
-                all_tests.extend(suite.tests)
-        return list(set(all_tests))  # Remove duplicates
+        return list(self._all_tests)  # Deduplicated, in configuration order
     
     def update_config(self, section: str, key: str, value: Any) -> None:
         """Update a configuration value and save to file."""
-        if section not in self.raw_config:
-            self.raw_config[section] = {}
-        
-        self.raw_config[section][key] = value
+        # Copy-on-write: the parsed file may be shared with other instances
+        self.raw_config = {
+            **self.raw_config,
+            section: {**self.raw_config.get(section, {}), key: value}
+        }
         
         # Save to file
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.raw_config, f, indent=2)
+        json_io.dump(self.raw_config, self.config_path)
         
-        # Reload configuration
-        self.load_configuration()
+        # Re-derive only what the changed section feeds
+        section_parsers = {
+            'performance': self._parse_performance,
+            'output': self._parse_output,
+            'system': self._parse_system,
+        }
+        if section in section_parsers:
+            section_parsers[section]()
+            self._validate_configuration()
+        else:
+            self._apply_raw_config()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary format."""
@@ -228,7 +322,9 @@ class BenchmarkConfig:
                 'compile_required': config.compile_required,
                 'compile_cmd': config.compile_cmd,
                 'binary_extension': config.binary_extension,
-                'runtime_args': config.runtime_args
+                'runtime_args': config.runtime_args,
+                'sample_interval': config.sample_interval,
+                'strict_check': config.strict_check
             } for name, config in self.languages.items()},
             'test_suites': {name: {
                 'enabled': config.enabled,
@@ -240,7 +336,9 @@ class BenchmarkConfig:
                 'iterations': self.performance.iterations,
                 'warmup_runs': self.performance.warmup_runs,
                 'timeout_per_test': self.performance.timeout_per_test,
-                'memory_sampling_interval': self.performance.memory_sampling_interval
+                'memory_sampling_interval': self.performance.memory_sampling_interval,
+                'parallel_iterations': self.performance.parallel_iterations,
+                'trace_orchestrator_memory': self.performance.trace_orchestrator_memory
             },
             'output': {
                 'format': self.output.format,
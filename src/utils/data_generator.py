@@ -4,23 +4,99 @@ Generates various file sizes, data types, and structured data for testing.
 """
 
 import os
-import json
-import csv
+import sys
+import fnmatch
 import random
 import string
 import gzip
+import itertools
+import shutil
 import tempfile
-from typing import Dict, List, Any, Union
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from utils import json_io
+
+# Userspace buffer for generated files; output is many small writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Rows whose random columns are drawn and formatted together
+CSV_BATCH_ROWS = 65536
+
+# JSON records generated and serialized together
+JSON_BATCH_RECORDS = 10000
+
+
+class GzipTier(IntEnum):
+    """Named gzip compression levels.
+    
+    SPEED suits write-once throwaway data, BALANCED is gzip's own default and
+    MAX trades CPU for the smallest output. They correspond roughly to zstd's
+    realtime (1-5), balanced (10-15) and archival (19-22) ranges.
+    """
+    SPEED = 1
+    BALANCED = 6
+    MAX = 9
+
+
+def _sample_space(items: List[str], sizes: Tuple[int, ...]) -> Tuple[Tuple[List[str], ...], ...]:
+    """All ordered samples of items for each size, as random.sample would return them."""
+    return tuple(tuple(list(p) for p in itertools.permutations(items, k)) for k in sizes)
+
 
 class DataGenerator:
     """Utility class for generating test data files."""
     
-    def __init__(self, base_dir: str = None):
-        """Initialize with optional base directory for test data."""
+    FIRST_NAMES = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry"]
+    LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
+    EMAIL_DOMAINS = ["example.com", "test.org", "demo.net", "sample.io"]
+    STREETS = ["Main St", "Oak Ave", "Pine Rd", "Elm Dr", "Maple Ln", "Cedar Ct"]
+    CITIES = ["Springfield", "Madison", "Franklin", "Georgetown", "Arlington", "Fairview"]
+    TAGS = ["python", "rust", "go", "typescript", "benchmark", "performance"]
+    
+    # Every outcome of random.sample(TAGS, k) for k = 1, 2, 3, grouped by k.
+    # The group sizes (6, 30, 120) all divide TAG_PICKS, so one uniform
+    # draw below TAG_PICKS indexes any group uniformly.
+    TAG_CHOICES = _sample_space(TAGS, (1, 2, 3))
+    TAG_PICKS = 120
+    
+    # Random words (3-12 letters) drawn once and reused by text and CSV data
+    WORD_POOL_SIZE = 50000
+    
+    # Sentences reused by text files. Large enough (~1 MB of text) that
+    # repeats rarely fall within one DEFLATE window, so compression tests
+    # still see realistic ratios.
+    SENTENCE_POOL_SIZE = 20000
+    
+    def __init__(self, base_dir: str = None, seed: Optional[int] = None):
+        """Initialize with optional base directory for test data.
+        
+        A seed makes every generated file reproducible; random state is
+        private to the instance.
+        """
         self.base_dir = Path(base_dir) if base_dir else Path(tempfile.gettempdir())
         self.base_dir.mkdir(exist_ok=True)
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed) if np is not None else None
+        self._word_pool: List[str] = []
+        self._sentence_pool: List[str] = []
     
     def generate_text_file(self, size_mb: float, filename: str = None) -> str:
         """Generate a text file of specified size in MB."""
@@ -30,31 +106,45 @@ class DataGenerator:
         filepath = self.base_dir / filename
         target_size = int(size_mb * 1024 * 1024)  # Convert to bytes
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        # Words are ASCII, so paragraphs are encoded once here and write()
+        # returns the byte count directly
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
             written = 0
             while written < target_size:
                 # Generate paragraphs of random text
                 paragraph = self._generate_paragraph()
-                f.write(paragraph + '\n\n')
-                written += len(paragraph.encode('utf-8')) + 2
+                written += f.write((paragraph + '\n\n').encode('ascii'))
         
         return str(filepath)
     
-    def generate_binary_file(self, size_mb: float, filename: str = None) -> str:
-        """Generate a binary file of specified size in MB."""
+    def generate_binary_file(self, size_mb: float, filename: str = None,
+                             seed: Optional[int] = None) -> str:
+        """Generate a binary file of specified size in MB.
+        
+        A seed here overrides the generator's own random state for this file.
+        """
         if filename is None:
             filename = f"test_binary_{size_mb}mb.bin"
         
         filepath = self.base_dir / filename
         target_size = int(size_mb * 1024 * 1024)
         
-        with open(filepath, 'wb') as f:
-            chunk_size = 8192
+        randbytes = self._rng.randbytes if seed is None else random.Random(seed).randbytes
+        
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            # Reserve the whole file up front so the filesystem can allocate
+            # contiguous extents instead of growing it chunk by chunk
+            if target_size > 0:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, target_size)
+                except (AttributeError, OSError):
+                    f.truncate(target_size)
+            
+            chunk_size = 1024 * 1024
             written = 0
             while written < target_size:
-                chunk = bytes(random.getrandbits(8) for _ in range(
-                    min(chunk_size, target_size - written)
-                ))
+                # Filled in C; unlike os.urandom this is reproducible from a seed
+                chunk = randbytes(min(chunk_size, target_size - written))
                 f.write(chunk)
                 written += len(chunk)
         
@@ -67,33 +157,46 @@ class DataGenerator:
         
         filepath = self.base_dir / filename
         
-        data = []
-        for i in range(num_records):
-            record = {
-                "id": i + 1,
-                "name": self._generate_name(),
-                "email": self._generate_email(),
-                "age": random.randint(18, 80),
-                "address": {
-                    "street": self._generate_street(),
-                    "city": self._generate_city(),
-                    "zipcode": f"{random.randint(10000, 99999)}"
-                },
-                "scores": [random.randint(0, 100) for _ in range(5)],
-                "metadata": {
-                    "created_at": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                    "active": random.choice([True, False]),
-                    "tags": random.sample(["python", "rust", "go", "typescript", "benchmark", "performance"], 
-                                        k=random.randint(1, 3))
-                }
-            }
-            data.append(record)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'[\n')
+            self._write_records(f, 1, num_records)
+            f.write(b'\n]\n')
         
         return str(filepath)
     
+    def generate_text_file_parallel(self, size_mb: float, filename: str = None,
+                                    workers: Optional[int] = None) -> str:
+        """Generate a text file of specified size in MB using several processes."""
+        if filename is None:
+            filename = f"test_text_{size_mb}mb.txt"
+        
+        workers = workers or os.cpu_count() or 1
+        if workers < 2:
+            return self.generate_text_file(size_mb, filename)
+        
+        parts = [('generate_text_file', (size_mb / workers, f"{filename}.part{i}"))
+                 for i in range(workers)]
+        return self._generate_in_parts(filename, parts, workers)
+    
+    def generate_json_file_parallel(self, num_records: int, filename: str = None,
+                                    workers: Optional[int] = None) -> str:
+        """Generate a JSON file with specified number of records using several processes."""
+        if filename is None:
+            filename = f"test_data_{num_records}records.json"
+        
+        workers = min(workers or os.cpu_count() or 1, max(num_records, 1))
+        if workers < 2:
+            return self.generate_json_file(num_records, filename)
+        
+        parts = []
+        first_id = 1
+        for i in range(workers):
+            count = num_records // workers + (1 if i < num_records % workers else 0)
+            parts.append(('_generate_json_part', (first_id, count, f"{filename}.part{i}")))
+            first_id += count
+        return self._generate_in_parts(filename, parts, workers,
+                                       header=b'[\n', separator=b',\n', footer=b'\n]\n')
+    
     def generate_csv_file(self, num_rows: int, num_cols: int = 10, filename: str = None) -> str:
         """Generate a CSV file with specified dimensions."""
         if filename is None:
@@ -103,32 +206,86 @@ class DataGenerator:
         
         headers = [f"col_{i+1}" for i in range(num_cols)]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
+        # Values are never quoted (words are lowercase letters), so rows are
+        # joined directly in the csv module's default dialect (CRLF endings)
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(','.join(headers) + '\r\n')
             
-            for row in range(num_rows):
-                data_row = []
+            for start in range(0, num_rows, CSV_BATCH_ROWS):
+                n = min(CSV_BATCH_ROWS, num_rows - start)
+                columns = []
                 for col in range(num_cols):
                     if col % 4 == 0:  # String column
-                        data_row.append(self._generate_word())
+                        columns.append(self._generate_words(n))
                     elif col % 4 == 1:  # Integer column
-                        data_row.append(random.randint(1, 10000))
+                        columns.append(self._formatted_integers(1, 10000, n))
                     elif col % 4 == 2:  # Float column
-                        data_row.append(round(random.uniform(0, 1000), 2))
+                        columns.append(self._formatted_floats(0, 1000, n, 2))
                     else:  # Boolean column
-                        data_row.append(random.choice(['true', 'false']))
-                writer.writerow(data_row)
+                        columns.append(['true' if v else 'false' for v in self._random_integers(0, 1, n)])
+                f.write('\r\n'.join(map(','.join, zip(*columns))) + '\r\n')
         
         return str(filepath)
     
-    def generate_compressed_data(self, original_file: str, compression_level: int = 6) -> str:
-        """Generate compressed version of a file using gzip."""
+    def generate_compressed_data(self, original_file: str, compression_level: Optional[int] = None,
+                                 codec: Optional[str] = None) -> str:
+        """Generate compressed version of a file.
+        
+        codec is 'gzip', 'zstd' or 'lz4'; by default zstd when zstandard is
+        installed, otherwise gzip. compression_level defaults to each codec's
+        fast setting (GzipTier.SPEED for gzip): the output is throwaway test
+        data, so generation speed matters more than ratio.
+        """
+        if codec is None:
+            codec = 'zstd' if zstandard is not None else 'gzip'
+        if codec == 'zstd':
+            level = 3 if compression_level is None else compression_level
+            return self.generate_zstd_compressed(original_file, level)
+        if codec == 'lz4':
+            return self._generate_lz4_compressed(original_file, compression_level or 0)
+        if codec != 'gzip':
+            raise ValueError(f"Unsupported compression codec: {codec}")
+        if compression_level is None:
+            compression_level = GzipTier.SPEED
+        
         compressed_path = original_file + '.gz'
         
-        with open(original_file, 'rb') as f_in:
-            with gzip.open(compressed_path, 'wb', compresslevel=compression_level) as f_out:
-                f_out.writelines(f_in)
+        # Fixed-size chunks straight from the raw file: no line splitting and
+        # no second read buffer
+        with open(original_file, 'rb', buffering=0) as f_in:
+            with open(compressed_path, 'wb', buffering=WRITE_BUFFER_SIZE) as raw_out, \
+                    gzip.GzipFile(fileobj=raw_out, mode='wb', compresslevel=compression_level) as f_out:
+                shutil.copyfileobj(f_in, f_out, WRITE_BUFFER_SIZE)
+        
+        return compressed_path
+    
+    def generate_zstd_compressed(self, original_file: str, level: int = 3) -> str:
+        """Generate zstd-compressed version of a file (requires zstandard)."""
+        if zstandard is None:
+            raise ImportError("zstandard is not installed; use the gzip codec")
+        
+        compressed_path = original_file + '.zst'
+        
+        with open(original_file, 'rb', buffering=0) as f_in:
+            with open(compressed_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f_out:
+                # threads=-1: one compression thread per CPU
+                zstandard.ZstdCompressor(level=level, threads=-1).copy_stream(
+                    f_in, f_out, read_size=WRITE_BUFFER_SIZE, write_size=WRITE_BUFFER_SIZE
+                )
+        
+        return compressed_path
+    
+    def _generate_lz4_compressed(self, original_file: str, level: int) -> str:
+        """Generate LZ4 frame-compressed version of a file (requires lz4)."""
+        if lz4_frame is None:
+            raise ImportError("lz4 is not installed; use the gzip codec")
+        
+        compressed_path = original_file + '.lz4'
+        
+        with open(original_file, 'rb', buffering=0) as f_in:
+            with open(compressed_path, 'wb', buffering=WRITE_BUFFER_SIZE) as raw_out, \
+                    lz4_frame.LZ4FrameFile(raw_out, mode='wb', compression_level=level) as f_out:
+                shutil.copyfileobj(f_in, f_out, WRITE_BUFFER_SIZE)
         
         return compressed_path
     
@@ -165,52 +322,175 @@ class DataGenerator:
     
     def cleanup_test_files(self, pattern: str = "test_*"):
         """Clean up generated test files matching pattern."""
-        for file_path in self.base_dir.glob(pattern):
-            try:
-                file_path.unlink()
-            except OSError:
-                pass  # File might be in use
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if fnmatch.fnmatchcase(entry.name, pattern):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass  # File might be in use
+    
+    def _generate_in_parts(self, filename: str, parts: List[Tuple[str, tuple]], workers: int,
+                           header: bytes = b'', separator: bytes = b'', footer: bytes = b'') -> str:
+        """Run generator methods in worker processes and join their files in order."""
+        filepath = self.base_dir / filename
+        # Each worker gets its own seed so a seeded generator stays reproducible
+        seeds = [self._rng.getrandbits(64) for _ in parts]
+        part_paths = [self.base_dir / args[-1] for _, args in parts]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_generate_part, [str(self.base_dir)] * len(parts),
+                                  [method for method, _ in parts],
+                                  [args for _, args in parts], seeds))
+            
+            with open(filepath, 'wb', buffering=0) as f_out:
+                f_out.write(header)
+                for i, part_path in enumerate(part_paths):
+                    if i:
+                        f_out.write(separator)
+                    with open(part_path, 'rb', buffering=0) as f_in:
+                        shutil.copyfileobj(f_in, f_out, WRITE_BUFFER_SIZE)
+                f_out.write(footer)
+        finally:
+            for part_path in part_paths:
+                try:
+                    part_path.unlink()
+                except FileNotFoundError:
+                    pass
+        
+        return str(filepath)
+    
+    def _generate_json_part(self, first_id: int, count: int, filename: str) -> str:
+        """Write records first_id.. as a JSON array body (no brackets)."""
+        filepath = self.base_dir / filename
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            self._write_records(f, first_id, count)
+        return str(filepath)
+    
+    def _write_records(self, f, first_id: int, count: int) -> None:
+        """Write count records to f, one compact JSON object per line.
+        
+        Records are generated and serialized one batch at a time (orjson when
+        installed, see utils.json_io), so memory stays bounded by one batch
+        regardless of count, and each batch is written with one call.
+        """
+        dumps = json_io.dumps
+        separator = b''
+        end = first_id + count
+        for batch_start in range(first_id, end, JSON_BATCH_RECORDS):
+            batch = self._generate_record_batch(batch_start, min(JSON_BATCH_RECORDS, end - batch_start))
+            f.write(separator)
+            f.write(b',\n'.join(map(dumps, batch)))
+            separator = b',\n'
+    
+    def _generate_record_batch(self, first_id: int, n: int):
+        """Yield n records numbered from first_id."""
+        # Draw every random field of a batch as a column up front so the
+        # record loop below only indexes into lists
+        ints = self._random_integers
+        first_names = ints(0, len(self.FIRST_NAMES) - 1, n)
+        last_names = ints(0, len(self.LAST_NAMES) - 1, n)
+        usernames = self._random_words(ints(5, 10, n))
+        domains = ints(0, len(self.EMAIL_DOMAINS) - 1, n)
+        ages = ints(18, 80, n)
+        house_numbers = ints(100, 9999, n)
+        streets = ints(0, len(self.STREETS) - 1, n)
+        cities = ints(0, len(self.CITIES) - 1, n)
+        zipcodes = ints(10000, 99999, n)
+        scores = ints(0, 100, n * 5)
+        months = ints(1, 12, n)
+        days = ints(1, 28, n)
+        active = ints(0, 1, n)
+        # random.sample(TAGS, k) for k in 1..3: pick k, then one ordered sample
+        tag_counts = ints(0, 2, n)
+        tag_picks = ints(0, self.TAG_PICKS - 1, n)
+        
+        for i in range(n):
+            tags = self.TAG_CHOICES[tag_counts[i]]
+            record = {
+                "id": first_id + i,
+                "name": f"{self.FIRST_NAMES[first_names[i]]} {self.LAST_NAMES[last_names[i]]}",
+                "email": f"{usernames[i]}@{self.EMAIL_DOMAINS[domains[i]]}",
+                "age": ages[i],
+                "address": {
+                    "street": f"{house_numbers[i]} {self.STREETS[streets[i]]}",
+                    "city": self.CITIES[cities[i]],
+                    "zipcode": f"{zipcodes[i]}"
+                },
+                "scores": scores[i * 5:i * 5 + 5],
+                "metadata": {
+                    "created_at": f"2024-{months[i]:02d}-{days[i]:02d}",
+                    "active": bool(active[i]),
+                    "tags": tags[tag_picks[i] % len(tags)].copy()
+                }
+            }
+            yield record
+    
+    def _random_integers(self, low: int, high: int, count: int) -> List[int]:
+        """count uniform integers in [low, high], drawn in one call."""
+        if np is not None:
+            return self._np_rng.integers(low, high + 1, size=count).tolist()
+        return self._rng.choices(range(low, high + 1), k=count)
+    
+    def _formatted_integers(self, low: int, high: int, count: int) -> List[str]:
+        """count uniform integers in [low, high] as decimal strings."""
+        if np is not None:
+            return np.char.mod('%d', self._np_rng.integers(low, high + 1, size=count)).tolist()
+        return list(map(str, self._rng.choices(range(low, high + 1), k=count)))
+    
+    def _formatted_floats(self, low: float, high: float, count: int, decimals: int) -> List[str]:
+        """count uniform floats in [low, high) formatted with fixed decimals."""
+        fmt = f'%.{decimals}f'
+        if np is not None:
+            return np.char.mod(fmt, self._np_rng.uniform(low, high, size=count)).tolist()
+        span = high - low
+        rand = self._rng.random
+        return list(map(fmt.__mod__, [low + span * rand() for _ in range(count)]))
+    
+    def _random_words(self, lengths: List[int]) -> List[str]:
+        """Lowercase words of the given lengths, cut from one random string."""
+        letters = ''.join(self._rng.choices(string.ascii_lowercase, k=sum(lengths)))
+        words = []
+        start = 0
+        for length in lengths:
+            words.append(letters[start:start + length])
+            start += length
+        return words
     
     def _generate_paragraph(self, sentences: int = None) -> str:
         """Generate a paragraph of random text."""
         if sentences is None:
-            sentences = random.randint(3, 8)
-        
-        paragraph_sentences = []
-        for _ in range(sentences):
-            words = [self._generate_word() for _ in range(random.randint(5, 15))]
-            sentence = ' '.join(words).capitalize() + '.'
-            paragraph_sentences.append(sentence)
-        
-        return ' '.join(paragraph_sentences)
-    
-    def _generate_word(self, length: int = None) -> str:
-        """Generate a random word."""
-        if length is None:
-            length = random.randint(3, 12)
-        return ''.join(random.choices(string.ascii_lowercase, k=length))
-    
-    def _generate_name(self) -> str:
-        """Generate a random name."""
-        first_names = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
-        return f"{random.choice(first_names)} {random.choice(last_names)}"
-    
-    def _generate_email(self) -> str:
-        """Generate a random email address."""
-        domains = ["example.com", "test.org", "demo.net", "sample.io"]
-        username = self._generate_word(random.randint(5, 10))
-        return f"{username}@{random.choice(domains)}"
-    
-    def _generate_street(self) -> str:
-        """Generate a random street address."""
-        streets = ["Main St", "Oak Ave", "Pine Rd", "Elm Dr", "Maple Ln", "Cedar Ct"]
-        return f"{random.randint(100, 9999)} {random.choice(streets)}"
-    
-    def _generate_city(self) -> str:
-        """Generate a random city name."""
-        cities = ["Springfield", "Madison", "Franklin", "Georgetown", "Arlington", "Fairview"]
-        return random.choice(cities)
+            sentences = self._rng.randint(3, 8)
+        
+        return ' '.join(self._rng.choices(self._sentences(), k=sentences))
+    
+    def _sentences(self) -> List[str]:
+        """The sentence pool, built on first use."""
+        if not self._sentence_pool:
+            # Bound once: this runs for every sentence in the pool
+            randint = self._rng.randint
+            choices = self._rng.choices
+            pool = self._words()
+            self._sentence_pool = [
+                ' '.join(choices(pool, k=randint(5, 15))).capitalize() + '.'
+                for _ in range(self.SENTENCE_POOL_SIZE)
+            ]
+        return self._sentence_pool
+    
+    def _generate_words(self, count: int) -> List[str]:
+        """Pick count random words from the word pool."""
+        return self._rng.choices(self._words(), k=count)
+    
+    def _words(self) -> List[str]:
+        """The word pool, built on first use."""
+        if not self._word_pool:
+            self._word_pool = self._random_words(self._random_integers(3, 12, self.WORD_POOL_SIZE))
+        return self._word_pool
+
+
+def _generate_part(base_dir: str, method: str, args: tuple, seed: int) -> str:
+    """Worker entry point for DataGenerator._generate_in_parts."""
+    return getattr(DataGenerator(base_dir, seed), method)(*args)
 
 
 def get_standard_test_sizes() -> Dict[str, float]:
@@ -247,13 +527,13 @@ if __name__ == "__main__":
     for name, size in sizes.items():
         if size <= 10:  # Only small/medium for example
             print(f"Creating {name} text file ({size}MB)...")
-            generator.generate_text_file(size, f"{name}_text.txt")
+            generator.generate_text_file_parallel(size, f"{name}_text.txt")
     
     # JSON files
     for name, count in records.items():
         if count <= 10000:  # Only small/medium for example
             print(f"Creating {name} JSON file ({count} records)...")
-            generator.generate_json_file(count, f"{name}_data.json")
+            generator.generate_json_file_parallel(count, f"{name}_data.json")
     
     # CSV files
     print("Creating CSV files...")
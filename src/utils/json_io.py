@@ -0,0 +1,46 @@
+"""
+JSON file helpers for configuration and reports.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load(path: str) -> Any:
+    """Parse a JSON file.
+
+    Raises json.JSONDecodeError on invalid input with either backend
+    (orjson.JSONDecodeError subclasses it).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dump(obj: Any, path: str, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """Write obj to a JSON file indented by two spaces."""
+    if orjson is not None:
+        data = orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    else:
+        data = json.dumps(obj, indent=2, default=default).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
@@ -4,86 +4,209 @@ Checks if required compilers and interpreters are available.
 """
 
 import os
+import atexit
+import copy
+import importlib.util
+import re
 import sys
 import subprocess
 import shutil
 import socket
-import urllib.request
+import threading
+import http.client
+import urllib.parse
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List, Tuple, Any
 from datetime import datetime
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from utils.config import BenchmarkConfig, LanguageConfig
+from utils.config import (BenchmarkConfig, LanguageConfig, CACHE_DIR, toolchain_fingerprint,
+                          load_json_cache, save_json_cache)
+
+# Language probe results from earlier runs, keyed by toolchain fingerprint
+ENV_PROBE_CACHE = os.path.join(CACHE_DIR, 'env.json')
+
+# Bump when the layout of persisted probe results changes
+ENV_PROBE_CACHE_SCHEMA = 2
+
+# Persisted probe results shared by every validator in this process: loaded
+# on first use and written back once, at exit, if any validator added to them
+_PERSISTED_PROBES: Optional[Dict[str, Dict[str, Any]]] = None
+_PERSISTED_PROBES_CHANGED = False
+_PERSISTED_PROBES_LOCK = threading.Lock()
+
+# Probe outcomes shared by every validator in this process, keyed by
+# _shared_probe_key so a replaced binary is probed again
+_SHARED_PROBES: Dict[Tuple[Any, ...], Any] = {}
+_SHARED_PROBES_LOCK = threading.Lock()
+
+
+def _shared_probe_key(command: List[str]) -> Tuple[Any, ...]:
+    """Key a probe command by resolved binary, its mtime, arguments, PATH and cwd."""
+    tool_path = shutil.which(command[0])
+    try:
+        mtime_ns = os.stat(tool_path).st_mtime_ns
+    except (OSError, TypeError):
+        mtime_ns = None
+    return (tool_path or command[0], mtime_ns, *command[1:],
+            os.environ.get('PATH', ''), os.getcwd())
+
+
+def _persisted_probes() -> Dict[str, Dict[str, Any]]:
+    """The process-wide persisted probe results, loaded on first use."""
+    global _PERSISTED_PROBES
+    with _PERSISTED_PROBES_LOCK:
+        if _PERSISTED_PROBES is None:
+            _PERSISTED_PROBES = load_json_cache(ENV_PROBE_CACHE, ENV_PROBE_CACHE_SCHEMA)
+        return _PERSISTED_PROBES
+
+
+def _remember_probe(key: str, probe: Dict[str, Any]) -> None:
+    """Add a probe result to be persisted at exit."""
+    global _PERSISTED_PROBES_CHANGED
+    probes = _persisted_probes()
+    with _PERSISTED_PROBES_LOCK:
+        probes[key] = probe
+        _PERSISTED_PROBES_CHANGED = True
+
+
+@atexit.register
+def _save_probe_cache() -> None:
+    """Persist language probe results if any validator added to them."""
+    global _PERSISTED_PROBES_CHANGED
+    with _PERSISTED_PROBES_LOCK:
+        if _PERSISTED_PROBES_CHANGED and save_json_cache(
+                ENV_PROBE_CACHE, ENV_PROBE_CACHE_SCHEMA, _PERSISTED_PROBES,
+                "environment validation cache"):
+            _PERSISTED_PROBES_CHANGED = False
 
 
 class EnvironmentValidator:
     """Validates language runtime environments."""
     
+    # Probes are process launches and network round trips, so threads overlap them
+    MAX_PROBE_WORKERS = 8
+    
+    # Endpoint whose response decides http_access in network checks
+    HTTP_ACCESS_URL = 'https://httpbin.org/get'
+    
+    # First line of version output that identifies each toolchain
+    VERSION_LINE_PATTERNS = {
+        'python': re.compile(r'^.*Python.*$', re.MULTILINE),
+        'rust': re.compile(r'^.*rustc.*$', re.MULTILINE),
+        'go': re.compile(r'^.*go version.*$', re.MULTILINE),
+        'typescript': re.compile(r'^.*v.*\..*$', re.MULTILINE),
+        'cpp': re.compile(r'^.*Microsoft.*C/C\+\+.*$', re.MULTILINE),
+    }
+    
     def __init__(self, config: BenchmarkConfig):
         self.config = config
         self.validation_cache: Dict[str, bool] = {}
         self.version_cache: Dict[str, str] = {}
+        self.executable_cache: Dict[str, bool] = {}
+        self.compilation_cache: Dict[str, bool] = {}
+        # Finished probe processes (or the exception they raised) by command
+        self.probe_cache: Dict[Tuple[str, ...], Any] = {}
+        # Aggregate per-language results of _full_probe
+        self.language_probe_cache: Dict[str, Dict[str, Any]] = {}
+        self.python_dependency_cache: Optional[List[str]] = None
+        # Idle keep-alive HTTP(S) connections by (scheme, host), so repeated
+        # probes of a host skip the TCP and TLS handshakes
+        self.http_connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+        self._http_lock = threading.Lock()
+        # Valid probes from earlier processes (shared process-wide)
+        self.persisted_probes: Dict[str, Dict[str, Any]] = _persisted_probes()
     
     def validate_all_languages(self) -> Dict[str, bool]:
         """Validate all configured languages."""
-        results = {}
+        languages = self.config.get_enabled_languages()
+        return dict(zip(languages, self._map_concurrently(self.validate_language, languages)))
+    
+    def _map_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to every item on a thread pool, keeping item order."""
+        if len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PROBE_WORKERS, len(items))) as executor:
+            return list(executor.map(func, items))
+    
+    def _full_probe(self, language: str) -> Dict[str, Any]:
+        """Check everything known about a language once.
         
-        for language in self.config.get_enabled_languages():
-            results[language] = self.validate_language(language)
+        Returns executable_found, works, compile_ok, version and valid;
+        validation, version lookup, reports and diagnostics all read from it.
+        """
+        if language in self.language_probe_cache:
+            return self.language_probe_cache[language]
         
-        return results
+        lang_config = self.config.get_language_config(language)
+        if not lang_config:
+            probe = {
+                'executable_found': False,
+                'works': False,
+                'compile_ok': False,
+                'version': "Unknown",
+                'valid': False
+            }
+        else:
+            # Toolchains change over days, so a later run with the same
+            # binaries and PATH reuses the result instead of launching them
+            key = self._probe_key(language, lang_config)
+            probe = self.persisted_probes.get(key)
+            if probe is None:
+                found = self._check_executable_exists(lang_config.executable)
+                works = found and self._check_executable_works(language, lang_config)
+                compile_ok = (self._check_compilation_tools(language, lang_config)
+                              if lang_config.compile_required else True)
+                probe = {
+                    'executable_found': found,
+                    'works': works,
+                    'compile_ok': compile_ok,
+                    'version': self._lookup_version(language, lang_config),
+                    'valid': found and works and compile_ok
+                }
+                if probe['valid']:  # keep re-probing until a setup works
+                    _remember_probe(key, probe)
+        
+        self.validation_cache[language] = probe['valid']
+        self.language_probe_cache[language] = probe
+        return probe
+    
+    @staticmethod
+    def _probe_key(language: str, lang_config: LanguageConfig) -> str:
+        """Fingerprint a language's toolchain (config, PATH, cwd, tool mtimes)."""
+        tools = [lang_config.executable]
+        if lang_config.compile_cmd:
+            tools.append(lang_config.compile_cmd.split()[0])
+        if language == 'rust':
+            tools.append('cargo')
+        elif language == 'typescript':
+            tools.append('npx')
+        return toolchain_fingerprint(tools, language, lang_config.executable,
+                                     lang_config.version_check or '',
+                                     lang_config.compile_cmd or '')
     
     def validate_language(self, language: str) -> bool:
         """Validate a specific language environment."""
         if language in self.validation_cache:
             return self.validation_cache[language]
-        
-        lang_config = self.config.get_language_config(language)
-        if not lang_config:
-            self.validation_cache[language] = False
-            return False
-        
-        # Check if executable exists
-        if not self._check_executable_exists(lang_config.executable):
-            self.validation_cache[language] = False
-            return False
-        
-        # Check if executable works
-        if not self._check_executable_works(language, lang_config):
-            self.validation_cache[language] = False
-            return False
-        
-        # For compiled languages, check compilation tools
-        if lang_config.compile_required:
-            if not self._check_compilation_tools(language, lang_config):
-                self.validation_cache[language] = False
-                return False
-        
-        self.validation_cache[language] = True
-        return True
+        return self._full_probe(language)['valid']
     
     def get_language_version(self, language: str) -> str:
         """Get version string for a language."""
         if language in self.version_cache:
             return self.version_cache[language]
-        
-        lang_config = self.config.get_language_config(language)
-        if not lang_config:
-            return "Unknown"
-        
+        return self._full_probe(language)['version']
+    
+    def _lookup_version(self, language: str, lang_config: LanguageConfig) -> str:
+        """Uncached version lookup behind get_language_version."""
         # Special handling for C++
         if language == 'cpp':
             try:
                 # Test compile script to get MSVC version
-                result = subprocess.run(
-                    ['cmd', '/c', 'compile_cpp.bat'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = self._probe(['cmd', '/c', 'compile_cpp.bat'])
                 # Extract version from stderr (MSVC outputs version info there)
                 version = self._extract_version(language, result.stderr)
                 self.version_cache[language] = version
@@ -95,12 +218,7 @@ class EnvironmentValidator:
             return "Available"
         
         try:
-            result = subprocess.run(
-                [lang_config.executable, lang_config.version_check],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = self._probe([lang_config.executable, lang_config.version_check])
             
             if result.returncode == 0:
                 # Extract version from output
@@ -117,15 +235,18 @@ class EnvironmentValidator:
         """Get detailed validation report for all languages."""
         report = {}
         
-        for language in self.config.get_enabled_languages():
+        languages = self.config.get_enabled_languages()
+        probes = self._map_concurrently(self._full_probe, languages)
+        
+        for language, probe in zip(languages, probes):
             lang_config = self.config.get_language_config(language)
             
             report[language] = {
                 'executable': lang_config.executable,
-                'executable_found': self._check_executable_exists(lang_config.executable),
-                'version': self.get_language_version(language),
+                'executable_found': probe['executable_found'],
+                'version': probe['version'],
                 'compile_required': lang_config.compile_required,
-                'validation_status': 'Valid' if self.validate_language(language) else 'Invalid'
+                'validation_status': 'Valid' if probe['valid'] else 'Invalid'
             }
             
             if lang_config.compile_required:
@@ -135,10 +256,17 @@ class EnvironmentValidator:
     
     def _check_executable_exists(self, executable: str) -> bool:
         """Check if an executable exists in PATH."""
+        # Each lookup walks PATH (and PATHEXT on Windows); reports ask repeatedly
+        if executable in self.executable_cache:
+            return self.executable_cache[executable]
+        
         # Special handling for C++ - we use a compile script
         if executable == 'cl.exe':
-            return os.path.exists('compile_cpp.bat')
-        return shutil.which(executable) is not None
+            found = os.path.exists('compile_cpp.bat')
+        else:
+            found = shutil.which(executable) is not None
+        self.executable_cache[executable] = found
+        return found
     
     def _check_executable_works(self, language: str, lang_config: LanguageConfig) -> bool:
         """Check if executable actually works."""
@@ -150,18 +278,18 @@ class EnvironmentValidator:
             return True  # Skip version check if not configured
         
         try:
-            result = subprocess.run(
-                [lang_config.executable, lang_config.version_check],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0
+            return self._probe([lang_config.executable, lang_config.version_check]).returncode == 0
         except Exception:
             return False
     
     def _check_compilation_tools(self, language: str, lang_config: LanguageConfig) -> bool:
         """Check if compilation tools are available."""
+        if language not in self.compilation_cache:
+            self.compilation_cache[language] = self._find_compilation_tools(language, lang_config)
+        return self.compilation_cache[language]
+    
+    def _find_compilation_tools(self, language: str, lang_config: LanguageConfig) -> bool:
+        """Uncached check behind _check_compilation_tools."""
         if not lang_config.compile_cmd:
             return False
         
@@ -177,13 +305,7 @@ class EnvironmentValidator:
             elif self._check_executable_exists('npx'):
                 # Test if TypeScript can be run via npx
                 try:
-                    result = subprocess.run(
-                        ['npx', 'tsc', '--version'],
-                        capture_output=True,
-                        text=True,
-                        timeout=15
-                    )
-                    return result.returncode == 0
+                    return self._probe(['npx', 'tsc', '--version'], timeout=15).returncode == 0
                 except Exception:
                     return False
             return False
@@ -200,39 +322,51 @@ class EnvironmentValidator:
         
         return self._check_executable_exists(compiler)
     
+    def _probe(self, command: List[str], timeout: int = 10) -> subprocess.CompletedProcess:
+        """Run a version/availability probe once per command and reuse the outcome.
+        
+        Validation, version lookup and diagnostics all probe the same tools;
+        a failed launch is cached too and re-raised on later calls.
+        """
+        key = tuple(command)
+        if key not in self.probe_cache:
+            # Other validators in the process may already have run it
+            shared_key = _shared_probe_key(command)
+            with _SHARED_PROBES_LOCK:
+                outcome = _SHARED_PROBES.get(shared_key)
+            if outcome is None:
+                try:
+                    outcome = subprocess.run(
+                        command,
+                        capture_output=True,
+                        text=True,
+                        timeout=timeout
+                    )
+                except Exception as e:
+                    outcome = e.with_traceback(None)
+                with _SHARED_PROBES_LOCK:
+                    outcome = _SHARED_PROBES.setdefault(shared_key, outcome)
+            self.probe_cache[key] = outcome
+        
+        outcome = self.probe_cache[key]
+        if isinstance(outcome, Exception):
+            # Raise a copy: a traceback on the cached exception would hold the
+            # raising frames, and with them this validator, for good
+            raise copy.copy(outcome)
+        return outcome
+    
     def _extract_version(self, language: str, version_output: str) -> str:
         """Extract version number from version command output."""
-        lines = version_output.strip().split('\\n')
-        
-        if language == 'python':
-            for line in lines:
-                if 'Python' in line:
-                    return line.strip()
-        
-        elif language == 'rust':
-            for line in lines:
-                if 'rustc' in line:
-                    return line.strip()
-        
-        elif language == 'go':
-            for line in lines:
-                if 'go version' in line:
-                    return line.strip()
-        
-        elif language == 'typescript':
-            # Node.js version for TypeScript
-            for line in lines:
-                if 'v' in line and '.' in line:
-                    return f"Node.js {line.strip()}"
-        
-        elif language == 'cpp':
-            # MSVC version for C++
-            for line in lines:
-                if 'Microsoft' in line and 'C/C++' in line:
-                    return line.strip()
+        pattern = self.VERSION_LINE_PATTERNS.get(language)
+        if pattern:
+            match = pattern.search(version_output)
+            if match:
+                line = match.group(0).strip()
+                # Node.js version for TypeScript
+                return f"Node.js {line}" if language == 'typescript' else line
         
         # Fallback: return first non-empty line
-        for line in lines:
+        for line in version_output.splitlines():
             if line.strip():
                 return line.strip()
         
@@ -302,26 +436,29 @@ class EnvironmentValidator:
             'recommendations': []
         }
         
-        for language in self.config.get_enabled_languages():
+        # Run the slow probes for all languages at once
+        languages = self.config.get_enabled_languages()
+        probes = self._map_concurrently(self._full_probe, languages)
+        
+        for language, probe in zip(languages, probes):
             lang_config = self.config.get_language_config(language)
             if not lang_config:
                 continue
                 
             # Basic validation
-            is_valid = self.validate_language(language)
-            version = self.get_language_version(language)
+            is_valid = probe['valid']
             
             diagnostic_report['language_status'][language] = {
                 'valid': is_valid,
-                'version': version,
+                'version': probe['version'],
                 'executable': lang_config.executable,
-                'executable_found': self._check_executable_exists(lang_config.executable),
+                'executable_found': probe['executable_found'],
                 'compile_required': lang_config.compile_required
             }
             
             # Compilation tools check
             if lang_config.compile_required:
-                compile_available = self._check_compilation_tools(language, lang_config)
+                compile_available = probe['compile_ok']
                 diagnostic_report['compilation_status'][language] = {
                     'available': compile_available,
                     'compile_cmd': lang_config.compile_cmd,
@@ -347,12 +484,7 @@ class EnvironmentValidator:
     def _get_node_version(self) -> str:
         """Get Node.js version if available."""
         try:
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe(['node', '--version'], timeout=5)
             if result.returncode == 0:
                 return result.stdout.strip()
         except Exception:
@@ -373,18 +505,18 @@ class EnvironmentValidator:
     
     def _check_python_dependencies(self) -> List[str]:
         """Check if required Python packages are available."""
-        required_packages = ['psutil', 'pandas', 'numpy']
-        missing_packages = []
+        if self.python_dependency_cache is not None:
+            return self.python_dependency_cache
         
-        for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
-                # psutil is now optional
-                if package == 'psutil':
-                    continue
-                missing_packages.append(package)
+        # psutil is now optional, so only these are reported
+        required_packages = ['pandas', 'numpy']
+        
+        # find_spec locates a package without running its import (pandas alone
+        # takes hundreds of milliseconds to import)
+        missing_packages = [package for package in required_packages
+                            if importlib.util.find_spec(package) is None]
         
+        self.python_dependency_cache = missing_packages
         return missing_packages
     
     def validate_network_connectivity(self) -> Dict[str, Any]:
@@ -397,33 +529,37 @@ class EnvironmentValidator:
             'test_endpoints': []
         }
         
-        # Test basic internet connectivity
-        network_status['internet_connectivity'] = self._test_internet_connectivity()
-        
-        # Test DNS resolution
-        network_status['dns_resolution'] = self._test_dns_resolution()
-        
-        # Test HTTP access
-        network_status['http_access'] = self._test_http_access()
-        
-        # Test ping capability
-        network_status['ping_capability'] = self._test_ping_capability()
-        
-        # Test specific endpoints
+        # The first endpoint doubles as the HTTP access check
         test_urls = [
-            'https://httpbin.org/get',
+            self.HTTP_ACCESS_URL,
             'https://jsonplaceholder.typicode.com/posts/1',
             'https://api.github.com/zen'
         ]
         
-        for url in test_urls:
-            status = self._test_endpoint(url)
-            network_status['test_endpoints'].append({
-                'url': url,
-                'accessible': status['accessible'],
-                'response_time': status['response_time'],
-                'error': status.get('error')
-            })
+        # Every check blocks on the network, so run them all concurrently
+        checks = {
+            'internet_connectivity': self._test_internet_connectivity,
+            'dns_resolution': self._test_dns_resolution,
+            'ping_capability': self._test_ping_capability,
+        }
+        with ThreadPoolExecutor(max_workers=len(checks) + len(test_urls)) as executor:
+            check_futures = {name: executor.submit(check) for name, check in checks.items()}
+            endpoint_futures = [executor.submit(self._test_endpoint, url) for url in test_urls]
+            
+            for name, future in check_futures.items():
+                network_status[name] = future.result()
+            
+            # Test specific endpoints
+            for url, future in zip(test_urls, endpoint_futures):
+                status = future.result()
+                if url == self.HTTP_ACCESS_URL:
+                    network_status['http_access'] = status.get('status_code') == 200
+                network_status['test_endpoints'].append({
+                    'url': url,
+                    'accessible': status['accessible'],
+                    'response_time': status['response_time'],
+                    'error': status.get('error')
+                })
         
         return network_status
     
@@ -431,8 +567,8 @@ class EnvironmentValidator:
         """Test basic internet connectivity."""
         try:
             # Try to connect to a reliable host
-            socket.create_connection(("8.8.8.8", 53), timeout=5)
-            return True
+            with socket.create_connection(("8.8.8.8", 53), timeout=5):
+                return True
         except OSError:
             return False
     
@@ -447,22 +583,65 @@ class EnvironmentValidator:
     def _test_http_access(self) -> bool:
         """Test HTTP/HTTPS access capability."""
         try:
-            with urllib.request.urlopen('https://httpbin.org/get', timeout=10) as response:
-                return response.status == 200
-        except (urllib.error.URLError, socket.timeout):
+            return self._request_status(self.HTTP_ACCESS_URL).status == 200
+        except (OSError, http.client.HTTPException):
             return False
     
     def _test_ping_capability(self) -> bool:
         """Test if ping command is available."""
-        ping_cmd = 'ping' if os.name == 'nt' else 'ping'
-        
-        try:
-            # Test with a single ping to a reliable host
-            cmd = [ping_cmd, '-c', '1', '8.8.8.8'] if os.name != 'nt' else [ping_cmd, '-n', '1', '8.8.8.8']
-            result = subprocess.run(cmd, capture_output=True, timeout=10)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        # Only the command's presence matters; reachability is already covered
+        # by _test_internet_connectivity without spawning a process
+        return self._check_executable_exists('ping')
+    
+    def _request_status(self, url: str, timeout: int = 5) -> http.client.HTTPResponse:
+        """Request only the headers of url, falling back to GET if HEAD is refused.
+        
+        The checks only look at the status, so there is no body to download.
+        Raises urllib.error.HTTPError for error statuses, like urlopen.
+        """
+        response = self._pooled_request(url, 'HEAD', timeout)
+        if response.status in (405, 501):
+            response = self._pooled_request(url, 'GET', timeout)
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.msg, None)
+        return response
+    
+    def _pooled_request(self, url: str, method: str, timeout: int) -> http.client.HTTPResponse:
+        """Send one request over a kept-alive connection to url's host."""
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        
+        # Take the connection out of the pool so no other thread shares it
+        with self._http_lock:
+            conn = self.http_connections.pop(key, None)
+        
+        while True:
+            reused = conn is not None
+            if not reused:
+                conn_class = (http.client.HTTPSConnection if parts.scheme == 'https'
+                              else http.client.HTTPConnection)
+                conn = conn_class(parts.netloc, timeout=timeout)
+            try:
+                conn.request(method, path, headers={'User-Agent': 'polyglot-bench'})
+                response = conn.getresponse()
+                response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped the idle connection; retry on a new one
+                conn = None
+        
+        with self._http_lock:
+            previous = self.http_connections.get(key)
+            self.http_connections[key] = conn
+        if previous is not None:
+            previous.close()
+        return response
     
     def _test_endpoint(self, url: str) -> Dict[str, Any]:
         """Test accessibility of a specific endpoint."""
@@ -470,13 +649,13 @@ class EnvironmentValidator:
         
         try:
             start_time = time.time()
-            with urllib.request.urlopen(url, timeout=10) as response:
-                response_time = time.time() - start_time
-                return {
-                    'accessible': True,
-                    'response_time': round(response_time * 1000, 2),  # Convert to ms
-                    'status_code': response.status
-                }
+            response = self._request_status(url)
+            response_time = time.time() - start_time
+            return {
+                'accessible': True,
+                'response_time': round(response_time * 1000, 2),  # Convert to ms
+                'status_code': response.status
+            }
         except Exception as e:
             return {
                 'accessible': False,
@@ -510,7 +689,7 @@ def validate_environment_interactive():
         config = BenchmarkConfig()
         validator = EnvironmentValidator(config)
         
-        print("\\nChecking language environments...")
+        print("\nChecking language environments...")
         validation_results = validator.validate_all_languages()
         
         all_valid = True
@@ -530,14 +709,14 @@ def validate_environment_interactive():
         # Check dependencies
         deps = validator.check_dependencies()
         if deps:
-            print("\\n Dependency Check:")
+            print("\n Dependency Check:")
             for language, missing_deps in deps.items():
                 if missing_deps:
                     print(f"  {language}: Missing packages: {', '.join(missing_deps)}")
                     print(f"    Install with: pip install {' '.join(missing_deps)}")
         
         # Check network connectivity for network tests
-        print("\\n Network Connectivity Check:")
+        print("\n Network Connectivity Check:")
         network_status = validator.validate_network_connectivity()
         
         connectivity_items = [
@@ -561,14 +740,14 @@ def validate_environment_interactive():
                     print(f"    {endpoint['url']}: {status_icon} ({endpoint.get('error', 'Unknown error')})")
         
         if all_valid:
-            print("\\n All environments are ready for benchmarking!")
+            print("\n All environments are ready for benchmarking!")
             return True
         else:
-            print("\\n  Some environments need attention before running benchmarks.")
+            print("\n  Some environments need attention before running benchmarks.")
             return False
             
     except Exception as e:
-        print(f"\\n Validation failed: {e}")
+        print(f"\n Validation failed: {e}")
         return False
 
 
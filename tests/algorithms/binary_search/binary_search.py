@@ -6,43 +6,36 @@ Performs binary search on a sorted array.
 
 import sys
 import time
-import random
+import numpy as np
 
 
-def binary_search(arr, target):
-    """Perform binary search on sorted array."""
-    left, right = 0, len(arr) - 1
+def binary_search(arr, targets):
+    """Binary search every target in the sorted array at once.
     
-    while left <= right:
-        mid = (left + right) // 2
-        
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    
-    return -1
+    Returns the index of each target, or -1 where it is absent.
+    """
+    idx = np.searchsorted(arr, targets)
+    # searchsorted gives the insertion point; the target is present only if
+    # that slot exists and holds it
+    in_bounds = idx < len(arr)
+    found = np.zeros(len(targets), dtype=np.bool_)
+    found[in_bounds] = arr[idx[in_bounds]] == targets[in_bounds]
+    return np.where(found, idx, -1)
 
 
 def main():
     """Main execution function."""
     size = 1000000
-    arr = list(range(size))
+    arr = np.arange(size, dtype=np.int64)
     num_searches = 1000
     
     # Generate random targets
-    targets = [random.randint(0, size-1) for _ in range(num_searches)]
+    targets = np.random.randint(0, size, num_searches, dtype=np.int64)
     
     print(f"Performing {num_searches} binary searches on array of size {size}...")
     start_time = time.perf_counter()
     
-    found_count = 0
-    for target in targets:
-        result = binary_search(arr, target)
-        if result != -1:
-            found_count += 1
+    found_count = int((binary_search(arr, targets) != -1).sum())
     
     end_time = time.perf_counter()
     execution_time = end_time - start_time
@@ -52,4 +45,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
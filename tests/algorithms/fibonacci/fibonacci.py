@@ -9,13 +9,20 @@ import time
 
 
 def fibonacci(n):
-    """Calculate the nth Fibonacci number iteratively."""
-    if n <= 1:
-        return n
-    a, b = 0, 1
-    for _ in range(n - 1):
-        a, b = b, a + b
-    return b
+    """Calculate the nth Fibonacci number by fast doubling in O(log n) steps.
+    
+    Uses F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    walking the bits of n from the most significant one.
+    """
+    a, b = 0, 1  # F(k), F(k+1) for the prefix of n's bits seen so far
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '0':
+            a, b = c, d
+        else:
+            a, b = d, c + d
+    return a
 
 
 def main():
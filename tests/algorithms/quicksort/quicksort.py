@@ -7,27 +7,71 @@ Sorts an array using the quicksort algorithm.
 import sys
 import time
 import random
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-def quicksort(arr):
-    """Sort array using quicksort algorithm."""
-    if len(arr) <= 1:
-        return arr
+
+def _jit(func):
+    """Compile func with Numba when it is installed, else leave it as Python."""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+@_jit
+def partition(arr, lo, hi):
+    """Hoare partition of arr[lo..hi] around its middle element.
+    
+    Returns p such that arr[lo..p] <= pivot <= arr[p+1..hi].
+    """
+    pivot = arr[(lo + hi) // 2]
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while arr[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def quicksort(arr, lo=0, hi=None):
+    """Sort array in place using quicksort algorithm and return it."""
+    if hi is None:
+        hi = len(arr) - 1
     
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
+    while lo < hi:
+        p = partition(arr, lo, hi)
+        # Recurse into the smaller half and loop on the larger one, keeping
+        # the recursion depth O(log n)
+        if p - lo < hi - p:
+            quicksort(arr, lo, p)
+            lo = p + 1
+        else:
+            quicksort(arr, p + 1, hi)
+            hi = p
     
-    return quicksort(left) + middle + quicksort(right)
+    return arr
 
 
 def main():
     """Main execution function."""
     # Generate test data
     size = 10000
-    arr = list(range(size))
-    random.shuffle(arr)
+    if njit is not None:
+        # The compiled partition needs a typed array; compile (or load it
+        # from Numba's cache) before the timed region
+        arr = np.random.permutation(size).astype(np.int64)
+        partition(np.array([1, 0], dtype=np.int64), 0, 1)
+    else:
+        arr = list(range(size))
+        random.shuffle(arr)
     
     print(f"Sorting array of size {size}...")
     start_time = time.perf_counter()
@@ -37,8 +81,9 @@ def main():
     end_time = time.perf_counter()
     execution_time = end_time - start_time
     
-    # Verify correctness
-    is_sorted = sorted_arr == sorted(arr)
+    # Verify correctness: the input is a permutation of 0..size-1, so the
+    # sorted output must be exactly that range (an O(n) comparison)
+    is_sorted = bool(np.array_equal(sorted_arr, np.arange(size)))
     
     print(f"Result: {'Sorted correctly' if is_sorted else 'Sort failed'}")
     print(f"Execution time: {execution_time:.6f} seconds")
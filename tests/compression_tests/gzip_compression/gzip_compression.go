@@ -212,7 +212,7 @@ func runCompressionBenchmark(config Parameters) BenchmarkResults {
 
 	compressionLevels := config.CompressionLevels
 	if compressionLevels == nil {
-		compressionLevels = []int{6}
+		compressionLevels = []int{1, 6}
 	}
 
 	iterations := config.Iterations
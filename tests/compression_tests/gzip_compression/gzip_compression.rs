@@ -173,7 +173,7 @@ fn try_compress_gzip(data: &[u8], compression_level: u32) -> Result<Vec<u8>, Box
 fn run_compression_benchmark(config: Parameters) -> BenchmarkResults {
     let input_sizes = config.input_sizes.unwrap_or_else(|| vec![1024]);
     let data_types = config.data_types.unwrap_or_else(|| vec!["text".to_string()]);
-    let compression_levels = config.compression_levels.unwrap_or_else(|| vec![6]);
+    let compression_levels = config.compression_levels.unwrap_or_else(|| vec![1, 6]);
     let iterations = config.iterations.unwrap_or(5);
     
     let mut results = BenchmarkResults {
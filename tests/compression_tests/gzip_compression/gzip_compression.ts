@@ -177,7 +177,7 @@ async function compressData(data: Buffer, compressionLevel: number): Promise<Com
 async function runCompressionBenchmark(config: any): Promise<BenchmarkResults> {
     const inputSizes = config.input_sizes || [1024];
     const dataTypes = config.data_types || ['text'];
-    const compressionLevels = config.compression_levels || [6];
+    const compressionLevels = config.compression_levels || [1, 6];
     const iterations = config.iterations || 5;
     
     const results: BenchmarkResults = {
@@ -6,13 +6,19 @@ Tests hash table operations (insert, lookup, delete).
 
 import sys
 import time
-import random
 import string
+import numpy as np
 
+ALPHABET = np.frombuffer((string.ascii_letters + string.digits).encode('ascii'), dtype=np.uint8)
 
-def random_string(length=10):
-    """Generate a random string of given length."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+
+def random_strings(count, length=10):
+    """Generate count random strings of given length in one batch."""
+    # One index draw and one gather for every character, then slice the
+    # joined text into keys instead of building each string separately
+    rng = np.random.default_rng()
+    text = ALPHABET[rng.integers(0, ALPHABET.size, count * length)].tobytes().decode('ascii')
+    return [text[i:i + length] for i in range(0, count * length, length)]
 
 
 def main():
@@ -20,8 +26,8 @@ def main():
     num_operations = 100000
     
     # Generate test data
-    keys = [random_string() for _ in range(num_operations)]
-    values = [random.randint(1, 1000000) for _ in range(num_operations)]
+    keys = random_strings(num_operations)
+    values = np.random.default_rng().integers(1, 1000001, num_operations).tolist()
     
     print(f"Testing hash table with {num_operations} operations...")
     start_time = time.perf_counter()
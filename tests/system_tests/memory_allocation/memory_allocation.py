@@ -37,6 +37,8 @@ def allocate_array(size: int, count: int) -> List[np.ndarray]:
 def allocate_linked_list(size: int, count: int) -> List[List[Dict]]:
     """Allocate linked list structures."""
     class ListNode:
+        __slots__ = ('value', 'next')  # compact nodes, no per-instance __dict__
+        
         def __init__(self, value: int, next_node=None):
             self.value = value
             self.next = next_node
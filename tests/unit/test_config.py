@@ -2,6 +2,7 @@ import unittest
 import os
 import sys
 import shutil
+import tempfile
 
 # Add src to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
@@ -44,5 +45,39 @@ class TestBenchmarkConfig(unittest.TestCase):
         non_existent_config = self.config.get_language_config("non_existent")
         self.assertIsNone(non_existent_config)
 
+    def test_get_all_tests(self):
+        """Test that get_all_tests lists tests of enabled suites only."""
+        self.assertEqual(self.config.get_all_tests(), ["fibonacci"])
+
+    def test_languages_read_only(self):
+        """Test that parsed language configurations cannot be replaced."""
+        with self.assertRaises(TypeError):
+            self.config.languages["python"] = None
+
+    def test_update_config(self):
+        """Test that update_config saves the value without touching other instances."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.config.json")
+            shutil.copyfile(self.config_path, path)
+            first = BenchmarkConfig(path)
+            second = BenchmarkConfig(path)
+
+            first.update_config("performance", "iterations", 3)
+            self.assertEqual(first.performance.iterations, 3)
+            self.assertEqual(second.performance.iterations, 10)
+            self.assertEqual(BenchmarkConfig(path).performance.iterations, 3)
+
+    def test_sample_interval(self):
+        """Test that sample_interval is read per language and defaults to 100ms."""
+        python_config = self.config.get_language_config("python")
+        self.assertEqual(python_config.sample_interval, 0.1)
+
+        rust_config = self.config.get_language_config("rust")
+        self.assertEqual(rust_config.sample_interval, 0.5)
+
+    def test_strict_check_defaults_off(self):
+        """Test that compile-time type-checking is opt-in."""
+        self.assertFalse(self.config.get_language_config("python").strict_check)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,16 @@
 import unittest
 import os
 import sys
+import csv
+import gzip
+import json
+import tempfile
+from pathlib import Path
 
 # Add src to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 
-from utils.data_generator import get_standard_test_sizes, get_standard_record_counts
+from utils.data_generator import DataGenerator, get_standard_test_sizes, get_standard_record_counts
 
 class TestDataGeneratorUtils(unittest.TestCase):
     def test_get_standard_test_sizes(self):
@@ -34,5 +39,89 @@ class TestDataGeneratorUtils(unittest.TestCase):
         for key, value in counts.items():
             self.assertIsInstance(value, int)
 
+class TestDataGenerator(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.generator = DataGenerator(self.tmp.name)
+
+    def test_generate_binary_file(self):
+        """Test that binary files have the exact size and follow the generator seed."""
+        first = DataGenerator(self.tmp.name, seed=7).generate_binary_file(1.5, "a.bin")
+        second = DataGenerator(self.tmp.name, seed=7).generate_binary_file(1.5, "b.bin")
+        self.assertEqual(os.path.getsize(first), int(1.5 * 1024 * 1024))
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_generate_binary_file_seed(self):
+        """Test that an explicit file seed overrides the generator's random state."""
+        first = DataGenerator(self.tmp.name, seed=1).generate_binary_file(0.25, "a.bin", seed=3)
+        second = DataGenerator(self.tmp.name, seed=2).generate_binary_file(0.25, "b.bin", seed=3)
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_generate_json_file(self):
+        """Test that JSON records are numbered and fields stay in range."""
+        path = self.generator.generate_json_file(200)
+        with open(path, encoding='utf-8') as f:
+            records = json.load(f)
+        self.assertEqual([r["id"] for r in records], list(range(1, 201)))
+        for record in records:
+            self.assertTrue(18 <= record["age"] <= 80)
+            self.assertEqual(len(record["scores"]), 5)
+            tags = record["metadata"]["tags"]
+            self.assertTrue(1 <= len(tags) <= 3)
+            self.assertEqual(len(set(tags)), len(tags))
+            self.assertIsInstance(record["metadata"]["active"], bool)
+
+    def test_generate_json_file_parallel(self):
+        """Test that parallel JSON parts join into one ordered array."""
+        path = self.generator.generate_json_file_parallel(25, workers=3)
+        with open(path, encoding='utf-8') as f:
+            records = json.load(f)
+        self.assertEqual([r["id"] for r in records], list(range(1, 26)))
+        self.assertEqual(os.listdir(self.tmp.name), [os.path.basename(path)])
+
+    def test_seed_reproduces_files(self):
+        """Test that generators with the same seed write identical files."""
+        contents = []
+        for name in ("a", "b"):
+            generator = DataGenerator(os.path.join(self.tmp.name, name), seed=11)
+            paths = [generator.generate_text_file(0.05), generator.generate_json_file(20),
+                     generator.generate_csv_file(20)]
+            contents.append([Path(path).read_bytes() for path in paths])
+        self.assertEqual(contents[0], contents[1])
+
+    def test_generate_compressed_data_gzip(self):
+        """Test that the gzip codec round-trips and unknown codecs are rejected."""
+        path = self.generator.generate_text_file(0.1)
+        compressed = self.generator.generate_compressed_data(path, codec='gzip')
+        self.assertTrue(compressed.endswith('.gz'))
+        with gzip.open(compressed, 'rb') as f:
+            self.assertEqual(f.read(), Path(path).read_bytes())
+        with self.assertRaises(ValueError):
+            self.generator.generate_compressed_data(path, codec='bz2')
+
+    def test_cleanup_test_files(self):
+        """Test that cleanup removes only files matching the pattern."""
+        for name in ("test_a.txt", "test_b.json", "keep.txt"):
+            open(os.path.join(self.tmp.name, name), 'w').close()
+        self.generator.cleanup_test_files()
+        self.assertEqual(os.listdir(self.tmp.name), ["keep.txt"])
+
+    def test_generate_csv_file(self):
+        """Test that CSV files have a header, the requested shape and typed columns."""
+        path = self.generator.generate_csv_file(50, num_cols=5)
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["col_1", "col_2", "col_3", "col_4", "col_5"])
+        self.assertEqual(len(rows), 51)
+        for row in rows[1:]:
+            self.assertEqual(len(row), 5)
+            self.assertTrue(row[0].isalpha())
+            self.assertTrue(1 <= int(row[1]) <= 10000)
+            self.assertTrue(0 <= float(row[2]) <= 1000)
+            self.assertIn(row[3], ("true", "false"))
+
 if __name__ == "__main__":
     unittest.main()
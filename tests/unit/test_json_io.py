@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# Add src to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from utils import json_io
+
+class TestJsonIO(unittest.TestCase):
+    def _round_trip(self):
+        data = {"name": "bench", "values": [1, 2.5, None], "when": datetime(2024, 1, 2, 3, 4, 5)}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.json")
+            json_io.dump(data, path, default=lambda obj: obj.isoformat())
+            with open(path, encoding="utf-8") as f:
+                self.assertIn('\n  "name"', f.read())
+            return json_io.load(path)
+
+    def test_round_trip(self):
+        """Test that dump/load round-trips data with the active backend."""
+        loaded = self._round_trip()
+        self.assertEqual(loaded["values"], [1, 2.5, None])
+        self.assertEqual(loaded["when"], "2024-01-02T03:04:05")
+
+    def test_stdlib_fallback(self):
+        """Test that the standard library backend is used without orjson."""
+        saved, json_io.orjson = json_io.orjson, None
+        try:
+            loaded = self._round_trip()
+        finally:
+            json_io.orjson = saved
+        self.assertEqual(loaded["name"], "bench")
+        self.assertEqual(loaded["when"], "2024-01-02T03:04:05")
+
+    def test_dumps_compact(self):
+        """Test that dumps emits the same compact bytes with either backend."""
+        data = {"id": 1, "tags": ["go", "rust"], "name": "Zoë"}
+        encoded = json_io.dumps(data)
+        saved, json_io.orjson = json_io.orjson, None
+        try:
+            self.assertEqual(json_io.dumps(data), encoded)
+        finally:
+            json_io.orjson = saved
+        self.assertEqual(encoded, '{"id":1,"tags":["go","rust"],"name":"Zoë"}'.encode("utf-8"))
+
+if __name__ == "__main__":
+    unittest.main()
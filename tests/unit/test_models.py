@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+from dataclasses import asdict
+
+# Add src to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from orchestrator import models
+
+class TestTestResult(unittest.TestCase):
+    def _make_result(self, output, error):
+        return models.TestResult(
+            execution_time=0.1,
+            memory_usage=1024,
+            cpu_usage=0.0,
+            output=output,
+            error=error,
+            success=True,
+            language="python",
+            test_name="fibonacci",
+            iteration=0
+        )
+
+    def test_bytes_output_is_decoded(self):
+        """Test that raw bytes output and error are exposed as text."""
+        result = self._make_result("résultat\n".encode("utf-8"), b"\xff")
+        self.assertEqual(result.output, "résultat\n")
+        self.assertEqual(result.error, "�")
+        self.assertEqual(asdict(result)["output"], "résultat\n")
+
+    def test_text_output_is_unchanged(self):
+        """Test that str output is stored and returned as-is."""
+        result = self._make_result("ok", "")
+        self.assertEqual(result.output, "ok")
+        self.assertEqual(result.error, "")
+
+    def test_failure(self):
+        """Test the failed-iteration factory."""
+        result = models.TestResult.failure(
+            language="go", test_name="fibonacci", iteration=3,
+            error="Timeout after 5s", execution_time=5.0
+        )
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "Timeout after 5s")
+        self.assertEqual(result.execution_time, 5.0)
+        self.assertEqual(result.memory_usage, 0)
+        self.assertEqual(result.output, "")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import os
+import sys
+
+# Add src to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from orchestrator import models
+from orchestrator import results
+
+class TestResultColumns(unittest.TestCase):
+    def _make_result(self, execution_time, memory_usage, success=True):
+        return models.TestResult(
+            execution_time=execution_time,
+            memory_usage=memory_usage,
+            cpu_usage=0.0,
+            output="",
+            error="",
+            success=success,
+            language="python",
+            test_name="fibonacci",
+            iteration=0
+        )
+
+    def test_language_performance(self):
+        """Test that column-wise aggregation skips failures and unmeasured memory."""
+        runs = [
+            self._make_result(0.1, 1000),
+            self._make_result(0.3, 0),
+            self._make_result(0.2, 3000),
+            self._make_result(9.9, 9999, success=False),
+        ]
+        compiler = results.ResultsCompiler()
+        perf = compiler._calculate_language_performance("python", "fibonacci", runs)
+        self.assertEqual(perf.total_iterations, 4)
+        self.assertEqual(perf.successful_iterations, 3)
+        self.assertAlmostEqual(perf.avg_time, 0.2)
+        self.assertAlmostEqual(perf.min_time, 0.1)
+        self.assertAlmostEqual(perf.max_time, 0.3)
+        self.assertAlmostEqual(perf.median_time, 0.2)
+        self.assertAlmostEqual(perf.std_time, 0.1)
+        self.assertEqual(perf.avg_memory, 2000.0)
+        self.assertEqual((perf.min_memory, perf.peak_memory), (1000, 3000))
+        self.assertEqual(perf.avg_cpu, 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
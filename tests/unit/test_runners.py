@@ -0,0 +1,154 @@
+import unittest
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from unittest import mock
+
+# Add src to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from utils.config import LanguageConfig
+from orchestrator.runners import PythonRunner, RustRunner, TypeScriptRunner, psutil
+
+# Assigning a string to a number: a type error, but valid JavaScript once emitted
+TYPE_ERROR_SOURCE = 'const answer: number = "forty-two";\nconsole.log(answer);\n'
+
+
+def typescript_config(strict_check):
+    return LanguageConfig(executable='node', version_check='--version', timeout=60,
+                          file_extension='.ts', compile_required=True, compile_cmd='tsc',
+                          strict_check=strict_check)
+
+
+class TestTypeScriptStrictCheck(unittest.TestCase):
+    def setUp(self):
+        # Runners create binaries/ in the working directory
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        if TypeScriptRunner._daemon:
+            TypeScriptRunner._daemon.close()
+        TypeScriptRunner._daemon = None
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_exit_status_acceptance(self):
+        """Test that tsc's "errors reported, output emitted" status only fails strict runs."""
+        relaxed = TypeScriptRunner('typescript', typescript_config(False))
+        strict = TypeScriptRunner('typescript', typescript_config(True))
+        self.assertTrue(relaxed._tsc_succeeded(0))
+        self.assertTrue(relaxed._tsc_succeeded(2))
+        self.assertFalse(relaxed._tsc_succeeded(1))
+        self.assertTrue(strict._tsc_succeeded(0))
+        self.assertFalse(strict._tsc_succeeded(2))
+
+    @unittest.skipUnless(shutil.which('tsc') and shutil.which('node'), "tsc is not installed")
+    def test_type_error_compiles_only_without_strict_check(self):
+        """Test a type error with the tsc worker and with one-shot tsc."""
+        source_file = os.path.join(self.temp_dir, 'type_error.ts')
+        with open(source_file, 'w') as f:
+            f.write(TYPE_ERROR_SOURCE)
+
+        # esbuild never type-checks; pin the tsc paths under test
+        with mock.patch.object(TypeScriptRunner, '_use_esbuild', return_value=False):
+            for use_daemon in (True, False):
+                with self.subTest(use_daemon=use_daemon):
+                    if TypeScriptRunner._daemon:
+                        TypeScriptRunner._daemon.close()
+                    TypeScriptRunner._daemon = None if use_daemon else False
+                    shutil.rmtree('binaries', ignore_errors=True)
+
+                    relaxed = TypeScriptRunner('typescript', typescript_config(False))
+                    js_file = relaxed.compile_test(source_file)
+                    self.assertIsNotNone(js_file)
+                    self.assertTrue(os.path.exists(js_file))
+
+                    strict = TypeScriptRunner('typescript', typescript_config(True))
+                    self.assertIsNone(strict.compile_test(source_file))
+
+
+@unittest.skipUnless(psutil, "psutil is not installed")
+class TestMonitorWorker(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_concurrent_processes_are_all_sampled(self):
+        """Test that processes running side by side each get their own metrics."""
+        config = LanguageConfig(executable='python', version_check='--version', timeout=30,
+                                file_extension='.py', sample_interval=0.05)
+        runner = PythonRunner('python', config)
+        # Start the sampling worker even where rusage would make it unnecessary
+        runner._monitor_queue = queue.Queue()
+        threading.Thread(target=runner._monitor_worker, daemon=True).start()
+
+        busy = 'import time\nx = bytearray(%d)\nend = time.time() + 0.5\nwhile time.time() < end: pass'
+        sizes = [20_000_000, 40_000_000, 60_000_000]
+        processes = [subprocess.Popen([sys.executable, '-c', busy % size]) for size in sizes]
+        monitors = [runner._begin_monitoring(process) for process in processes]
+
+        for size, process, monitor in zip(sizes, processes, monitors):
+            process.wait()
+            peak_memory, cpu_usage = runner._resource_usage(process, 0.5, monitor)
+            self.assertGreaterEqual(peak_memory, size)
+            self.assertGreater(cpu_usage, 0.0)
+
+
+@unittest.skipUnless(shutil.which('cargo'), "cargo is not installed")
+class TestRustCompile(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        # Keep the shared target directory out of the user's cache
+        patcher = mock.patch('orchestrator.runners.RUST_CACHE_DIR', os.path.join(self.temp_dir, 'cache'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_concurrent_compiles_keep_their_own_binaries(self):
+        """Test that compiles sharing a target directory each get their own program."""
+        config = LanguageConfig(executable='cargo', version_check='--version', timeout=30,
+                                file_extension='.rs', compile_required=True, compile_cmd='cargo build')
+        sources = {}
+        for name in ('alpha', 'beta'):
+            sources[name] = os.path.join(self.temp_dir, f'{name}.rs')
+            with open(sources[name], 'w') as f:
+                f.write(f'fn main() {{ println!("{name}"); }}\n')
+
+        binaries = {}
+        def compile_source(name):
+            binaries[name] = RustRunner('rust', config).compile_test(sources[name])
+        threads = [threading.Thread(target=compile_source, args=(name,)) for name in sources]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name, binary in binaries.items():
+            self.assertIsNotNone(binary)
+            output = subprocess.run([binary], capture_output=True, text=True).stdout
+            self.assertEqual(output.strip(), name)
+        # Only the shared dependency state stays behind
+        target_dir = os.listdir(os.path.join(self.temp_dir, 'cache'))
+        self.assertEqual(len(target_dir), 1)
+        release_dir = os.path.join(self.temp_dir, 'cache', target_dir[0], 'release')
+        self.assertFalse([f for f in os.listdir(release_dir) if f.startswith('benchmark_rust_')])
+
+
+if __name__ == '__main__':
+    unittest.main()
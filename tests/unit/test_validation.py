@@ -0,0 +1,33 @@
+import unittest
+import os
+import sys
+
+# Add src to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from utils.config import BenchmarkConfig
+from utils.validation import EnvironmentValidator
+
+class TestExtractVersion(unittest.TestCase):
+    def setUp(self):
+        self.validator = EnvironmentValidator(BenchmarkConfig())
+
+    def test_matching_line_in_multiline_output(self):
+        """Test that the toolchain line is found past the first line."""
+        output = "info: syncing channel\nrustc 1.75.0 (82e1608df 2023-12-21)\n"
+        self.assertEqual(self.validator._extract_version("rust", output),
+                         "rustc 1.75.0 (82e1608df 2023-12-21)")
+
+    def test_typescript_reports_node(self):
+        """Test that TypeScript reports the Node.js version."""
+        self.assertEqual(self.validator._extract_version("typescript", "v20.11.1\n"),
+                         "Node.js v20.11.1")
+
+    def test_fallback_first_line(self):
+        """Test the first non-empty line fallback and the empty case."""
+        self.assertEqual(self.validator._extract_version("rust", "\ncargo 1.75.0\nmore\n"),
+                         "cargo 1.75.0")
+        self.assertEqual(self.validator._extract_version("go", ""), "Version unknown")
+
+if __name__ == "__main__":
+    unittest.main()